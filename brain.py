@@ -1,5 +1,5 @@
 import math
-from typing import Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 import torch
@@ -12,10 +12,24 @@ from config import (
     MUTATION_SCALE,
     BRAIN_PLASTICITY_RATE,
     BRAIN_PLASTICITY_DECAY,
+    USE_GPU,
+    BRAIN_BF16_MATMUL,
+    BRAIN_COMPILE,
+    BRAIN_COMPILE_BUCKET,
 )
 
-# Use GPU if available (RTX 3080 friendly), otherwise fall back to CPU.
-DEVICE = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+# CPU by default; CUDA only when USE_GPU is set and a GPU is present
+# (checked lazily so CPU runs never initialise the CUDA runtime).
+DEVICE = torch.device("cuda" if USE_GPU and torch.cuda.is_available() else "cpu")
+
+# Derived once at import instead of on every plasticity step.
+_PLASTICITY_KEEP = 1.0 - BRAIN_PLASTICITY_DECAY
+_MUTATES = MUTATION_RATE > 0.0
+
+# Per-brain tensors, in the order BrainPool stacks them. w_in / w_rec are
+# column views of w_combined and _last_post_h aliases h; _bind_views() re-derives them.
+_PARAM_FIELDS = ("w_combined", "b_h", "w_out", "b_out")
+_STATE_FIELDS = ("h", "_last_pre_h")
 
 
 class Brain:
@@ -28,6 +42,12 @@ class Brain:
     - Evolution across generations handled via copy_mutated().
     """
 
+    # Scratch buffers for mutation, shared by all brains and reused across births:
+    # (device, dtype) -> (uniform draws, Bernoulli mask, gaussian noise).
+    _mutation_buffers: Dict[
+        Tuple[torch.device, torch.dtype], Tuple[torch.Tensor, torch.Tensor, torch.Tensor]
+    ] = {}
+
     def __init__(
         self,
         in_size: int = BRAIN_INPUT_SIZE,
@@ -50,60 +70,74 @@ class Brain:
 
         if params is None:
             # Randomly initialise parameters
-            self.w_in = torch.randn(hidden, in_size, device=self.device) * 0.6
-            self.w_rec = torch.randn(hidden, hidden, device=self.device) * 0.2
+            w_in = torch.randn(hidden, in_size, device=self.device) * 0.6
+            w_rec = torch.randn(hidden, hidden, device=self.device) * 0.2
             self.b_h = torch.zeros(hidden, device=self.device)
 
             self.w_out = torch.randn(out_size, hidden, device=self.device) * 0.6
             self.b_out = torch.zeros(out_size, device=self.device)
         else:
-            self.w_in, self.w_rec, self.b_h, self.w_out, self.b_out = [
+            w_in, w_rec, self.b_h, self.w_out, self.b_out = [
                 p.to(self.device) for p in params
             ]
 
+        # Input and recurrent weights live side by side in one [hidden, in + hidden]
+        # matrix, so the recurrent update is a single addmv over [x; h].
+        self.w_combined = torch.cat([w_in, w_rec], dim=1)
+
         # Recurrent hidden state (memory), 1D [hidden]
-        self.h = torch.zeros(BRAIN_HIDDEN, device=self.device)
+        self.h = torch.zeros(self.w_combined.shape[0], device=self.device)
 
-        # Pre/post states for plasticity
+        # Pre/post states for plasticity. The post state is h itself: nothing
+        # touches h between a forward pass and the plasticity update that reads it.
         self._last_pre_h = torch.zeros_like(self.h)
-        self._last_post_h = torch.zeros_like(self.h)
+        self._bind_views()
+
+        # Set by BrainPool.attach(); tensors above are then views onto pool rows.
+        self._pool: Optional["BrainPool"] = None
+        self._slot: int = -1
 
     # --------------------------------------------------------------------- #
     # Core API
     # --------------------------------------------------------------------- #
 
+    def _bind_views(self) -> None:
+        """Point w_in / w_rec at their column blocks of w_combined, _last_post_h at h."""
+        n_in = self.w_combined.shape[1] - self.w_combined.shape[0]
+        self.w_in = self.w_combined[:, :n_in]
+        self.w_rec = self.w_combined[:, n_in:]
+        self._last_post_h = self.h
+
     def reset_state(self) -> None:
         """Reset the recurrent hidden state (e.g. on birth/world reset)."""
         self.h.zero_()
         self._last_pre_h.zero_()
-        self._last_post_h.zero_()
 
     def forward(self, x: np.ndarray) -> Tuple[float, float]:
         """
         Single control step.
 
-        :param x: NumPy input vector of shape (in_size,).
+        :param x: NumPy input vector of shape (in_size,); float32 avoids a cast.
         :return: (turn_torque_norm in [-1, 1], thrust_norm in [0, 1]).
         """
         # Convert NumPy -> torch on correct device
         x_t = torch.as_tensor(x, dtype=torch.float32, device=self.device)
 
-        # Store previous state for plasticity
-        self._last_pre_h = self.h.clone()
-
-        # Recurrent update: h_t = tanh(W_in x + W_rec h_{t-1} + b)
-        h_lin = torch.matmul(self.w_in, x_t) + torch.matmul(self.w_rec, self.h) + self.b_h
-        self.h = torch.tanh(h_lin)
+        # Store previous state for plasticity. All state updates are in-place so
+        # a pooled brain keeps writing through to its BrainPool row.
+        self._last_pre_h.copy_(self.h)
 
-        # Store post state
-        self._last_post_h = self.h.clone()
+        # Recurrent update: h_t = tanh([W_in | W_rec] [x; h_{t-1}] + b)
+        xh = torch.cat([x_t, self.h])
+        h_lin = torch.addmv(self.b_h, self.w_combined, xh)
+        torch.tanh(h_lin, out=self.h)
 
         # Output layer: o = tanh(W_out h + b)
-        o = torch.tanh(torch.matmul(self.w_out, self.h) + self.b_out)
+        o = torch.addmv(self.b_out, self.w_out, self.h).tanh_()
 
-        # Turn is in [-1, 1], thrust is mapped from [-1, 1] -> [0, 1]
-        turn_raw = float(o[0].item())
-        thrust_raw = float(o[1].item())
+        # Turn is in [-1, 1], thrust is mapped from [-1, 1] -> [0, 1].
+        # One host transfer for both outputs; BrainPool.forward_batch() does one per tick.
+        turn_raw, thrust_raw = o[:2].tolist()
         thrust_norm = (thrust_raw + 1.0) * 0.5
 
         return turn_raw, thrust_norm
@@ -118,7 +152,7 @@ class Brain:
                        produced it; negative -> weaken them. Typically clipped.
         """
         # Weight decay to keep dynamics bounded
-        self.w_rec.mul_(1.0 - BRAIN_PLASTICITY_DECAY)
+        self.w_rec.mul_(_PLASTICITY_KEEP)
 
         if reward == 0.0:
             return
@@ -139,41 +173,70 @@ class Brain:
     # Evolutionary mutation
     # --------------------------------------------------------------------- #
 
-    def _mutate_tensor(self, t: torch.Tensor) -> torch.Tensor:
+    def _mutate_tensor(
+        self, t: torch.Tensor, generator: Optional[torch.Generator] = None
+    ) -> torch.Tensor:
         """
         Apply in-place evolutionary mutation to a tensor and return it.
+        Callers pass a contiguous tensor they own (a clone or a fresh pool row).
 
         Each element is mutated with probability MUTATION_RATE by adding
-        Gaussian noise with std MUTATION_SCALE.
+        Gaussian noise with std MUTATION_SCALE. `generator` defaults to torch's
+        global RNG.
         """
-        if MUTATION_RATE <= 0.0:
+        if not _MUTATES:
             return t
 
-        # Create Bernoulli mask
-        mask = torch.rand_like(t, device=self.device) < MUTATION_RATE
-        if mask.any():
-            noise = torch.randn_like(t, device=self.device) * MUTATION_SCALE
-            t = t + noise * mask  # create new tensor so we don't accidentally share
+        # Bernoulli mask and noise for every element, applied with one masked
+        # addcmul: nothing is read back to the host (no count, no boolean
+        # indexing), so on CUDA a birth never waits for the device.
+        # All draws go into cached buffers, so a birth never hits the allocator.
+        u, mask, noise = self._scratch(t, t.numel())
+        torch.lt(u.uniform_(generator=generator), MUTATION_RATE, out=mask)
+        noise.normal_(0.0, MUTATION_SCALE, generator=generator)
+        t.view(-1).addcmul_(mask, noise)
         return t
 
+    @classmethod
+    def _scratch(
+        cls, t: torch.Tensor, numel: int
+    ) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
+        """Mutation scratch buffers for t's device/dtype, at least numel long."""
+        key = (t.device, t.dtype)
+        bufs = cls._mutation_buffers.get(key)
+        if bufs is None or bufs[0].numel() < numel:
+            bufs = (
+                torch.empty(numel, device=t.device, dtype=t.dtype),
+                torch.empty(numel, device=t.device, dtype=torch.bool),
+                torch.empty(numel, device=t.device, dtype=t.dtype),
+            )
+            cls._mutation_buffers[key] = bufs
+        u, mask, noise = bufs
+        return u[:numel], mask[:numel], noise[:numel]
+
     def copy_mutated(self) -> "Brain":
         """
         Copy this brain and apply evolutionary mutation to all parameters.
 
         This is the across-generations adaptation (evolution).
         Within-lifetime adaptation happens via apply_plasticity().
+        A pooled brain's child is written straight into a free row of the same pool.
         """
-        w_in = self._mutate_tensor(self.w_in.clone())
-        w_rec = self._mutate_tensor(self.w_rec.clone())
+        if self._pool is not None:
+            return self._pool.copy_mutated(self)
+
+        w_combined = self._mutate_tensor(self.w_combined.clone())
         b_h = self._mutate_tensor(self.b_h.clone())
         w_out = self._mutate_tensor(self.w_out.clone())
         b_out = self._mutate_tensor(self.b_out.clone())
 
+        hidden = w_combined.shape[0]
+        n_in = w_combined.shape[1] - hidden
         child = Brain(
-            in_size=w_in.shape[1],
-            hidden=w_in.shape[0],
+            in_size=n_in,
+            hidden=hidden,
             out_size=w_out.shape[0],
-            params=(w_in, w_rec, b_h, w_out, b_out),
+            params=(w_combined[:, :n_in], w_combined[:, n_in:], b_h, w_out, b_out),
             device=self.device,
         )
         child.reset_state()
@@ -186,14 +249,329 @@ class Brain:
     def to(self, device: torch.device) -> "Brain":
         """
         Move this brain's parameters and state to a new device (cpu/cuda).
+        A pooled brain is detached from its pool first.
         """
+        if self._pool is not None:
+            self._pool.release(self)
         self.device = device
-        self.w_in = self.w_in.to(device)
-        self.w_rec = self.w_rec.to(device)
+        self.w_combined = self.w_combined.to(device)
         self.b_h = self.b_h.to(device)
         self.w_out = self.w_out.to(device)
         self.b_out = self.b_out.to(device)
         self.h = self.h.to(device)
         self._last_pre_h = self._last_pre_h.to(device)
-        self._last_post_h = self._last_post_h.to(device)
+        self._bind_views()
         return self
+
+
+def _forward_rows(
+    w_combined: torch.Tensor,
+    b_h: torch.Tensor,
+    w_out: torch.Tensor,
+    b_out: torch.Tensor,
+    x: torch.Tensor,
+    h_prev: torch.Tensor,
+) -> Tuple[torch.Tensor, torch.Tensor]:
+    """
+    Batched recurrent step on gathered rows; returns (h_new [N, H], o [N, O]).
+
+    Kept free of pool state so BrainPool can hand it to torch.compile as is.
+    """
+    # h_t = tanh([W_in | W_rec] [x; h_{t-1}] + b) for all rows in one baddbmm
+    xh = torch.cat([x, h_prev], dim=1).unsqueeze(2)
+    h_lin = torch.baddbmm(b_h.unsqueeze(2), w_combined, xh)
+    # tanh in place on the fresh GEMM outputs: no extra temporaries
+    h_new = h_lin.squeeze(2).tanh_().float()
+
+    o = torch.baddbmm(b_out.unsqueeze(2), w_out, h_new.unsqueeze(2))
+    o = o.squeeze(2).tanh_().float()
+    return h_new, o
+
+
+def _plasticity_rows(
+    w_rec: torch.Tensor, post: torch.Tensor, pre: torch.Tensor
+) -> torch.Tensor:
+    """
+    Batched Hebbian update on gathered rows; returns the new w_rec [N, H, H].
+
+    Decay and the outer products are one broadcast multiply-add: an outer
+    product is a K=1 GEMM, which baddbmm runs ~10x slower than addcmul on
+    CPU, and elementwise ops fuse trivially when compiled.
+    `post` is expected to carry the per-row learning rate already.
+    """
+    return torch.addcmul(w_rec * _PLASTICITY_KEEP, post.unsqueeze(2), pre.unsqueeze(1))
+
+
+class BrainPool:
+    """
+    Stacked storage for a whole population of brains.
+
+    Every attached Brain keeps its usual attributes (w_in, w_rec, h, ...), but they
+    become views onto one row of the pool's [capacity, ...] tensors, so per-brain
+    code (dreams, plasticity, mutation) keeps working unchanged while
+    forward_batch() advances any subset of brains with a few batched kernels
+    instead of several tiny launches and two `.item()` syncs per organism.
+
+    All parameters of a brain sit in one contiguous row of `params`
+    ([capacity, n_params]); w_combined, b_h, w_out and b_out are shaped views of
+    its column blocks. That lets copy_mutated() clone and mutate a whole brain
+    with one row copy and a single uniform/normal draw from the pool's own
+    seeded generator.
+
+    A pool holds brains of one size only (attach() copies into fixed-shape
+    rows), so forward_batch() is always a single shape group; with
+    BRAIN_COMPILE that group is compiled once for its static, padded shapes.
+
+    Capacity doubles on demand; freed rows are recycled.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 64,
+        in_size: int = BRAIN_INPUT_SIZE,
+        hidden: int = BRAIN_HIDDEN,
+        out_size: int = BRAIN_OUTPUT_SIZE,
+        device: Optional[torch.device] = None,
+        seed: Optional[int] = None,
+    ) -> None:
+        self.device = device if device is not None else DEVICE
+        self.capacity = 0
+
+        # Dedicated RNG for mutations, seeded by the World for reproducible runs
+        self.generator = torch.Generator(device=self.device)
+        if seed is None:
+            self.generator.seed()
+        else:
+            self.generator.manual_seed(seed)
+        # bf16 tensor-core GEMMs with fp32 master copies; CPUs gain nothing from it
+        self._bf16 = BRAIN_BF16_MATMUL and self.device.type == "cuda"
+
+        # Optional fused step: Inductor turns both GEMMs + bias + tanh (and the
+        # plasticity update) into a few kernels (CUDA graphs on GPU). Padded
+        # batches keep shapes static.
+        self._forward_rows = _forward_rows
+        self._plasticity_rows = _plasticity_rows
+        self._bucket = 1
+        if BRAIN_COMPILE and hasattr(torch, "compile"):
+            mode = "reduce-overhead" if self.device.type == "cuda" else None
+            self._forward_rows = torch.compile(_forward_rows, mode=mode, dynamic=False)
+            self._plasticity_rows = torch.compile(_plasticity_rows, mode=mode, dynamic=False)
+            self._bucket = max(1, BRAIN_COMPILE_BUCKET)
+
+        self.in_size = in_size
+        self._param_shapes = {
+            "w_combined": (hidden, in_size + hidden),
+            "b_h": (hidden,),
+            "w_out": (out_size, hidden),
+            "b_out": (out_size,),
+        }
+        self.n_params = sum(math.prod(shape) for shape in self._param_shapes.values())
+        self.params = torch.zeros(0, self.n_params, device=self.device)
+        self._bind_param_views()
+
+        self.h = torch.zeros(0, hidden, device=self.device)
+        self._last_pre_h = torch.zeros(0, hidden, device=self.device)
+
+        self._brains: List[Optional[Brain]] = []
+        self._free: List[int] = []
+        self._grow(max(1, capacity))
+
+    def __len__(self) -> int:
+        return self.capacity - len(self._free)
+
+    # ----------------------------------------------------------------- #
+    # Membership
+    # ----------------------------------------------------------------- #
+
+    def attach(self, brain: Brain) -> None:
+        """
+        Copy `brain` into a free row and rebind its tensors to views of that row.
+        No-op if the brain already lives in this pool.
+        """
+        if brain._pool is self:
+            return
+        if brain._pool is not None:
+            brain._pool.release(brain)
+
+        slot = self._alloc_slot()
+        for name in _PARAM_FIELDS + _STATE_FIELDS:
+            getattr(self, name)[slot].copy_(getattr(brain, name))
+        self._bind(brain, slot)
+
+    def release(self, brain: Brain) -> None:
+        """
+        Give `brain` private copies of its tensors and free its row for reuse.
+        """
+        if brain._pool is not self:
+            return
+        for name in _PARAM_FIELDS + _STATE_FIELDS:
+            setattr(brain, name, getattr(brain, name).clone())
+        brain._bind_views()
+        self._brains[brain._slot] = None
+        self._free.append(brain._slot)
+        brain._pool = None
+        brain._slot = -1
+
+    def _alloc_slot(self) -> int:
+        if not self._free:
+            self._grow(2 * self.capacity)
+        return self._free.pop()
+
+    def _bind(self, brain: Brain, slot: int) -> None:
+        for name in _PARAM_FIELDS + _STATE_FIELDS:
+            setattr(brain, name, getattr(self, name)[slot])
+        brain._bind_views()
+        brain.device = self.device
+        brain._pool = self
+        brain._slot = slot
+        self._brains[slot] = brain
+
+    def _bind_param_views(self) -> None:
+        """Carve the per-field [capacity, ...] views out of the flat params buffer."""
+        rows = self.params.shape[0]
+        offset = 0
+        for name in _PARAM_FIELDS:
+            shape = self._param_shapes[name]
+            size = math.prod(shape)
+            block = self.params[:, offset : offset + size]
+            setattr(self, name, block.view((rows,) + shape))
+            offset += size
+
+        self.w_in = self.w_combined[:, :, : self.in_size]
+        self.w_rec = self.w_combined[:, :, self.in_size :]
+
+    def _grow(self, capacity: int) -> None:
+        """Reallocate every stack with `capacity` rows and rebind member views."""
+        old = self.capacity
+        for name in ("params",) + _STATE_FIELDS:
+            stack = getattr(self, name)
+            grown = torch.zeros((capacity,) + tuple(stack.shape[1:]), device=self.device)
+            grown[:old] = stack
+            setattr(self, name, grown)
+        self._bind_param_views()
+
+        self.capacity = capacity
+        self._brains.extend([None] * (capacity - old))
+        # pop() hands out the lowest free row first
+        self._free.extend(range(capacity - 1, old - 1, -1))
+
+        for slot, brain in enumerate(self._brains):
+            if brain is not None:
+                self._bind(brain, slot)
+
+    # ----------------------------------------------------------------- #
+    # Batched ops
+    # ----------------------------------------------------------------- #
+
+    def forward_batch(self, brains: List[Brain], x: np.ndarray) -> np.ndarray:
+        """
+        One control step for many pooled brains at once.
+
+        :param brains: N brains attached to this pool.
+        :param x:      NumPy inputs of shape (N, in_size), row i feeding brains[i];
+                       float32 is used without a copy.
+        :return: NumPy array (N, 2): turn in [-1, 1], thrust in [0, 1].
+        """
+        n = len(brains)
+        slots = [b._slot for b in brains]
+        x = np.asarray(x, dtype=np.float32)
+
+        pad = -n % self._bucket
+        if pad:
+            # repeat the first row; padded results are dropped below
+            slots = slots + [slots[0]] * pad
+            x = np.concatenate([x, np.repeat(x[:1], pad, axis=0)])
+
+        idx = torch.as_tensor(slots, dtype=torch.long, device=self.device)
+        x_t = torch.as_tensor(x, device=self.device)
+        h_prev = self.h.index_select(0, idx)
+
+        with torch.autocast(self.device.type, dtype=torch.bfloat16, enabled=self._bf16):
+            h_new, o = self._forward_rows(
+                self.w_combined.index_select(0, idx),
+                self.b_h.index_select(0, idx),
+                self.w_out.index_select(0, idx),
+                self.b_out.index_select(0, idx),
+                x_t,
+                h_prev,
+            )
+
+        idx, h_prev, h_new, o = idx[:n], h_prev[:n], h_new[:n], o[:n]
+        self._last_pre_h.index_copy_(0, idx, h_prev)
+        self.h.index_copy_(0, idx, h_new)
+
+        # Single device -> host transfer for the whole population
+        out = o.cpu().numpy()
+        out[:, 1] = (out[:, 1] + 1.0) * 0.5
+        return out
+
+    def apply_plasticity_batch(self, brains: List[Brain], rewards: np.ndarray) -> None:
+        """
+        Brain.apply_plasticity() for many pooled brains at once.
+
+        ΔW_rec[n] = eta[n] * post[n] pre[n]^T after decay, as one gather, one
+        broadcast multiply-add and one scatter back into the pool.
+        Call it after the matching forward_batch() for the same brains.
+
+        :param brains:  N brains attached to this pool.
+        :param rewards: NumPy rewards of shape (N,), already clipped/scaled.
+        """
+        n = len(brains)
+        slots = [b._slot for b in brains]
+        # scale on the host: one fewer elementwise kernel on the device
+        eta = np.asarray(rewards, dtype=np.float32) * np.float32(BRAIN_PLASTICITY_RATE)
+
+        pad = -n % self._bucket
+        if pad:
+            # padded rows get eta = 0 and are dropped before the scatter
+            slots = slots + [slots[0]] * pad
+            eta = np.concatenate([eta, np.zeros(pad, dtype=np.float32)])
+
+        idx = torch.as_tensor(slots, dtype=torch.long, device=self.device)
+        eta_t = torch.as_tensor(eta, device=self.device)
+
+        post = self.h.index_select(0, idx) * eta_t.unsqueeze(1)
+        pre = self._last_pre_h.index_select(0, idx)
+
+        w_rec = self._plasticity_rows(self.w_rec.index_select(0, idx), post, pre)
+        self.w_rec.index_copy_(0, idx[:n], w_rec[:n])
+
+    def copy_mutated(self, parent: Brain) -> Brain:
+        """
+        Write a mutated copy of `parent` into a free row and return it as a new Brain.
+        """
+        slot = self._alloc_slot()
+        row = self.params[slot]
+        if parent._pool is self:
+            row.copy_(self.params[parent._slot])
+        else:
+            for name in _PARAM_FIELDS:
+                getattr(self, name)[slot].copy_(getattr(parent, name))
+
+        # One mask + one noise draw over every parameter of the child
+        parent._mutate_tensor(row, self.generator)
+        for name in _STATE_FIELDS:
+            getattr(self, name)[slot].zero_()
+
+        child = Brain.__new__(Brain)
+        self._bind(child, slot)
+        return child
+
+    def crossover_mutated(self, parent_a: Brain, parent_b: Brain) -> Brain:
+        """
+        Write the average of two pooled parents, mutated, into a free row and
+        return it as a new Brain (sexual reproduction's counterpart of copy_mutated).
+        """
+        slot = self._alloc_slot()
+        row = self.params[slot]
+        torch.add(self.params[parent_a._slot], self.params[parent_b._slot], out=row)
+        row.mul_(0.5)
+
+        # Same single mask + noise draw from the pool generator as copy_mutated()
+        parent_a._mutate_tensor(row, self.generator)
+        for name in _STATE_FIELDS:
+            getattr(self, name)[slot].zero_()
+
+        child = Brain.__new__(Brain)
+        self._bind(child, slot)
+        return child
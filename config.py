@@ -72,6 +72,20 @@ THRUST_MIN, THRUST_MAX = 0.5, 2.0       # multiplier
 META_MIN, META_MAX = 0.6, 1.6           # multiplier
 
 # --- Brain / Learning / Development ---
+# Run brains on CUDA (if available). The 6→16→2 controller is latency-bound:
+# host↔device copies and launches cost far more than the math, so CPU is
+# faster unless the batched population gets very large.
+USE_GPU = False
+
+# Batched brain GEMMs in bfloat16 (tensor cores) when running on CUDA.
+# Weights and hidden state stay fp32 so small plasticity updates aren't rounded away.
+BRAIN_BF16_MATMUL = True
+
+# Compile the batched brain step with torch.compile (needs a C++/Triton toolchain).
+# Batches are padded to multiples of BRAIN_COMPILE_BUCKET so shapes stay static.
+BRAIN_COMPILE = False
+BRAIN_COMPILE_BUCKET = 32
+
 # Neural controller size
 BRAIN_INPUT_SIZE = 6        # [left, right, energy, speed, age, bias]
 BRAIN_HIDDEN = 16           # can safely increase (32, 64…) with RTX 3080
@@ -3,6 +3,8 @@ from __future__ import annotations
 import random
 from typing import Tuple
 
+import numpy as np
+
 from config import (
     MUTATION_RATE,
     MUTATION_SCALE,
@@ -16,6 +18,16 @@ from config import (
     META_MAX,
 )
 
+# Per-trait clamp bounds in inherit_traits_batch() column order:
+# (fov_deg, range_len, thrust_eff, metabolism_eff)
+TRAIT_BOUNDS = np.array(
+    [
+        [FOV_MIN, RANGE_MIN, THRUST_MIN, META_MIN],
+        [FOV_MAX, RANGE_MAX, THRUST_MAX, META_MAX],
+    ],
+    dtype=float,
+)
+
 
 def mutate_val(
     base: float,
@@ -56,3 +68,26 @@ def inherit_traits(parent, rng: random.Random) -> Tuple[float, float, float, flo
     thrust_eff = mutate_val(parent.trait_thrust_eff, THRUST_MIN, THRUST_MAX, rng)
     meta_eff = mutate_val(parent.trait_metabolism_eff, META_MIN, META_MAX, rng)
     return fov, rng_len, thrust_eff, meta_eff
+
+
+def inherit_traits_batch(
+    parent_traits: np.ndarray,
+    rng: np.random.Generator,
+    rate: float = MUTATION_RATE,
+    scale: float = MUTATION_SCALE,
+) -> np.ndarray:
+    """
+    Vectorized asexual trait inheritance for many parents at once.
+
+    parent_traits: [N, 4] array of (fov_deg, range_len, thrust_eff, metabolism_eff).
+    Each value mutates with probability `rate` (Gaussian noise, std `scale`),
+    then every column is clamped to TRAIT_BOUNDS.
+
+    Returns:
+        [N, 4] array of child traits.
+    """
+    shape = parent_traits.shape
+    mask = rng.random(shape) < rate
+    noise = rng.standard_normal(shape) * scale
+    out = parent_traits + mask * noise
+    return np.clip(out, TRAIT_BOUNDS[0], TRAIT_BOUNDS[1], out=out)
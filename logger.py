@@ -3,21 +3,25 @@ Central logging utility for the Micro-Organism Simulation.
 
 Provides:
 - Console logging (periodic status output)
-- CSV logging (population, births, deaths, food count, weather)
-- GPU awareness (logs device = cuda/cpu)
+- CSV logging (population, births, deaths, food count, weather), buffered in
+  memory and written out in batches so the main loop never blocks on file I/O
+- GPU awareness (logs the brain device = cuda/cpu, resolved once at startup)
 
 All logging behavior is controlled from config.py (intervals, toggles).
 """
 
+import atexit
 import csv
 import os
 import time
-from typing import Optional
-
-import torch
+from typing import List, Optional
 
+from brain import DEVICE
 from config import STATUS_PRINT_INTERVAL
 
+# Flush buffered CSV rows early once this many are pending
+CSV_MAX_PENDING = 256
+
 
 class Logger:
     def __init__(self, log_dir: str = "logs", csv_name: str = "world_log.csv") -> None:
@@ -51,8 +55,19 @@ class Logger:
                     ]
                 )
 
-        # last time we printed a console update
-        self.last_print_time: float = time.time()
+        # Brain device is fixed at import; never query the driver per tick
+        self._device_str: str = DEVICE.type
+
+        # last time we printed a console update (time.monotonic(): intervals
+        # must not jump with wall-clock adjustments)
+        self.last_print_time: float = time.monotonic()
+
+        # CSV file stays open; rows are buffered and written in batches
+        self._f = open(self.csv_path, "a", newline="", buffering=1 << 16)
+        self._writer = csv.writer(self._f)
+        self._pending: List[list] = []
+        self.last_flush_time: float = self.last_print_time
+        atexit.register(self.close)
 
     # ------------------------------------------------------------------ #
     # Console logging
@@ -61,8 +76,10 @@ class Logger:
     def maybe_print(self, world, now: Optional[float] = None) -> None:
         """
         Print an update to the console if enough time has passed.
+
+        :param now: time.monotonic() reading to use, if the caller already took one.
         """
-        now = time.time() if now is None else now
+        now = time.monotonic() if now is None else now
         if now - self.last_print_time < STATUS_PRINT_INTERVAL:
             return
         self.last_print_time = now
@@ -70,16 +87,13 @@ class Logger:
         pop = world.population()
         food_count = len(world.foods)
 
-        # environment info
+        # environment info + trait averages (shared with log_csv this tick)
         env = world.env
-        temp = env.temperature_at_y(world.env.time % 1 * 100)  # quick sampling
+        stats = world.tick_stats()
+        temp = stats["temp"]
         precip = env.precipitation
         dayf = env.day_night_factor
-
-        # trait averages
-        fov, rng_len, thr, meta = world.avg_traits()
-
-        device = "cuda" if torch.cuda.is_available() else "cpu"
+        fov, rng_len, thr, meta = stats["fov"], stats["rng"], stats["thr"], stats["meta"]
 
         print(
             f"[t={world.time:7.1f}s]  "
@@ -87,20 +101,21 @@ class Logger:
             f"births={world.births:3d} deaths={world.deaths:3d}  "
             f"temp≈{temp:5.1f}°C  precip={precip:.2f}  day={dayf:.2f}  "
             f"FOV={fov:.1f}  range={rng_len:.1f}  thr={thr:.2f}  meta={meta:.2f}  "
-            f"[{device}]"
+            f"[{self._device_str}]"
         )
 
     # ------------------------------------------------------------------ #
     # CSV Logging
     # ------------------------------------------------------------------ #
 
-    def log_csv(self, world) -> None:
+    def log_csv(self, world, now: Optional[float] = None) -> None:
         """
         Write a CSV row with world stats.
+
+        :param now: time.monotonic() reading to use, as for maybe_print().
         """
         env = world.env
-
-        fov, rng_len, thr, meta = world.avg_traits()
+        stats = world.tick_stats()
 
         row = [
             world.time,
@@ -108,16 +123,43 @@ class Logger:
             world.births,
             world.deaths,
             len(world.foods),
-            fov,
-            rng_len,
-            thr,
-            meta,
-            env.temperature_at_y(world.env.time % 1 * 100),
+            stats["fov"],
+            stats["rng"],
+            stats["thr"],
+            stats["meta"],
+            stats["temp"],
             env.precipitation,
             env.day_night_factor,
-            "cuda" if torch.cuda.is_available() else "cpu",
+            self._device_str,
         ]
 
-        with open(self.csv_path, "a", newline="") as f:
-            csv.writer(f).writerow(row)
+        self._pending.append(row)
+
+        now = time.monotonic() if now is None else now
+        if (
+            len(self._pending) > CSV_MAX_PENDING
+            or now - self.last_flush_time >= STATUS_PRINT_INTERVAL
+        ):
+            self.flush()
+            self.last_flush_time = now
+
+    def flush(self) -> None:
+        """
+        Write all pending CSV rows to disk.
+        """
+        if self._f.closed:
+            return
+        if self._pending:
+            self._writer.writerows(self._pending)
+            self._pending.clear()
+        self._f.flush()
+
+    def close(self) -> None:
+        """
+        Flush pending rows and close the CSV file (safe to call twice).
+        """
+        if self._f.closed:
+            return
+        self.flush()
+        self._f.close()
 
@@ -1,10 +1,12 @@
 import math
-import time
 import random
+import numpy as np
 import pygame
 import sys
+import time
 
-from world import World, Food
+from world import World
+from organism import state_columns
 from logger import Logger
 from config import (
     WORLD_WIDTH,
@@ -20,11 +22,22 @@ from config import (
     FOOD_COLOR,
     FOOD_GLOW,
     HOME_RADIUS,
-    HOME_BUILD_ENERGY_COST,
 )
 
 from utils import clamp
 
+# Pre-rendered organism sprites (glow + body + heading), one per heading
+# bucket (a power of two for the index mask)
+ORG_SPRITE_ANGLES = 64
+ORG_SPRITE_HALF = 12
+_org_sprites = []
+_food_sprite = None
+
+# Weather overlay: font loaded once, text surface re-rendered only on change
+_overlay_font = None
+_overlay_txt = None
+_overlay_surf = None
+
 
 def draw_grid(surface):
     """Subtle grid background for visualization."""
@@ -34,13 +47,20 @@ def draw_grid(surface):
         pygame.draw.line(surface, GRID_COLOR, (0, y), (WORLD_WIDTH, y), 1)
 
 
+def food_sprite():
+    """Glow + core for one food particle, drawn once."""
+    global _food_sprite
+    if _food_sprite is None:
+        _food_sprite = pygame.Surface((10, 10), pygame.SRCALPHA)
+        pygame.draw.circle(_food_sprite, FOOD_GLOW, (5, 5), 5)
+        pygame.draw.circle(_food_sprite, FOOD_COLOR, (5, 5), 3)
+    return _food_sprite
+
+
 def draw_food(surface, food_list):
-    """Draw food particles with a soft glow."""
-    for f in food_list:
-        # Glow
-        pygame.draw.circle(surface, FOOD_GLOW, (int(f.x), int(f.y)), 5)
-        # Core
-        pygame.draw.circle(surface, FOOD_COLOR, (int(f.x), int(f.y)), 3)
+    """Draw food particles with a soft glow (one blits() call for all of them)."""
+    sprite = food_sprite()
+    surface.blits([(sprite, (int(f.x) - 5, int(f.y) - 5)) for f in food_list], doreturn=False)
 
 
 def draw_home(surface, pos):
@@ -51,61 +71,165 @@ def draw_home(surface, pos):
     pygame.draw.circle(surface, (100, 200, 255), (int(x), int(y)), int(HOME_RADIUS), 1)
 
 
-def draw_organism(surface, org, draw_fov=False):
-    """Draw organisms with orientation, FOV arcs, home markers, and trails."""
-
-    x = int(org.x)
-    y = int(org.y)
-    angle = org.angle
+def org_sprites():
+    """
+    Glow + body + heading drawn once per discretized angle.
 
-    # Glow behind organism
-    pygame.draw.circle(surface, ORG_GLOW, (x, y), 9)
+    Built lazily so the per-frame cost of an organism is a single blit.
+    """
+    if not _org_sprites:
+        c = ORG_SPRITE_HALF
+        size = 2 * c
+        for i in range(ORG_SPRITE_ANGLES):
+            a = i * 2 * math.pi / ORG_SPRITE_ANGLES
+            s = pygame.Surface((size, size), pygame.SRCALPHA)
+            pygame.draw.circle(s, ORG_GLOW, (c, c), 9)
+            pygame.draw.circle(s, ORG_COLOR, (c, c), 5)
+            hx = c + int(math.cos(a) * 10)
+            hy = c + int(math.sin(a) * 10)
+            pygame.draw.line(s, (255, 255, 255), (c, c), (hx, hy), 2)
+            _org_sprites.append(s)
+    return _org_sprites
+
+
+def org_sprite_index(angle):
+    """Heading bucket of the pre-rendered sprite closest to `angle`."""
+    return int(angle * (ORG_SPRITE_ANGLES / (2 * math.pi)) + 0.5) & (ORG_SPRITE_ANGLES - 1)
+
+
+def fov_ray_ends(orgs):
+    """
+    Integer FOV ray geometry for many organisms from one cos/sin pass.
 
-    # Body
-    pygame.draw.circle(surface, ORG_COLOR, (x, y), 5)
+    :return: NumPy int array (N, 6): x, y, left x, left y, right x, right y.
+    """
+    x, y, angle, fov, rng_len = state_columns(
+        orgs, "x", "y", "angle", "trait_fov_deg", "trait_range"
+    )
+    half = np.radians(fov) / 2
+    left = angle - half
+    right = angle + half
+    # astype(int) truncates toward zero like int()
+    return np.column_stack(
+        (
+            x,
+            y,
+            x.astype(int) + (np.cos(left) * rng_len).astype(int),
+            y.astype(int) + (np.sin(left) * rng_len).astype(int),
+            x.astype(int) + (np.cos(right) * rng_len).astype(int),
+            y.astype(int) + (np.sin(right) * rng_len).astype(int),
+        )
+    ).astype(int)
+
+
+def draw_organism_overlays(surface, org, rays=None):
+    """
+    Per-organism extras drawn under the sprites: home, trail and FOV rays.
 
-    # Heading
-    hx = x + int(math.cos(angle) * 10)
-    hy = y + int(math.sin(angle) * 10)
-    pygame.draw.line(surface, (255, 255, 255), (x, y), (hx, hy), 2)
+    :param rays: (x, y, lx, ly, rx, ry) from fov_ray_ends(), or None for no FOV.
+    """
 
     # Home
     if org.home_pos:
         draw_home(surface, org.home_pos)
 
     # Trail (optional)
-    if len(org.trail) > 1:
-        pts = [(int(px), int(py)) for (px, py) in org.trail]
-        pygame.draw.lines(surface, (100, 255, 140), False, pts, 1)
+    # (drawn straight from the ring buffer's views; pygame truncates the float
+    # points like int())
+    color = (100, 255, 140)
+    runs = org.trail_runs()
+    if len(runs) == 2:
+        # join the two runs across the ring's seam
+        pygame.draw.line(surface, color, runs[0][-1], runs[1][0], 1)
+    for run in runs:
+        if len(run) > 1:
+            pygame.draw.lines(surface, color, False, run, 1)
 
     # FOV overlay
-    if draw_fov:
-        fov_rad = math.radians(org.trait_fov_deg)
-        left = angle - fov_rad / 2
-        right = angle + fov_rad / 2
-
-        lx = x + int(math.cos(left) * org.trait_range)
-        ly = y + int(math.sin(left) * org.trait_range)
-        rx = x + int(math.cos(right) * org.trait_range)
-        ry = y + int(math.sin(right) * org.trait_range)
-
+    if rays is not None:
+        x, y, lx, ly, rx, ry = rays
         pygame.draw.line(surface, (0, 200, 100), (x, y), (lx, ly), 1)
         pygame.draw.line(surface, (0, 200, 100), (x, y), (rx, ry), 1)
 
 
+def draw_organisms(surface, orgs, draw_fov=False):
+    """
+    Draw organisms with orientation, FOV arcs, home markers, and trails.
+
+    Overlays go first; glow, body and heading for every organism then land in
+    a single blits() call from the pre-rendered sprites.
+    """
+    if not orgs:
+        return
+    if draw_fov:
+        for o, rays in zip(orgs, fov_ray_ends(orgs).tolist()):
+            draw_organism_overlays(surface, o, rays)
+    else:
+        for o in orgs:
+            draw_organism_overlays(surface, o)
+
+    sprites = org_sprites()
+    h = ORG_SPRITE_HALF
+    surface.blits(
+        [(sprites[org_sprite_index(o.angle)], (int(o.x) - h, int(o.y) - h)) for o in orgs],
+        doreturn=False,
+    )
+
+
 def draw_weather_overlay(surface, env):
     """
     Draw small weather UI: temperature, precipitation, day/night bar.
     """
-    font = pygame.font.SysFont("consolas", 16)
+    global _overlay_font, _overlay_txt, _overlay_surf
+    if _overlay_font is None:
+        _overlay_font = pygame.font.SysFont("consolas", 16)
+
     temp_text = f"{env.last_global_growth_rate:.3f} growth"
     precip = f"precip={env.precipitation:.2f}"
     day = f"day={env.day_night_factor:.2f}"
 
     txt = f"{temp_text}   {precip}   {day}"
 
-    surf = font.render(txt, True, (255, 255, 255))
-    surface.blit(surf, (10, 10))
+    if txt != _overlay_txt:
+        _overlay_txt = txt
+        _overlay_surf = _overlay_font.render(txt, True, (255, 255, 255))
+    surface.blit(_overlay_surf, (10, 10))
+
+
+# --------------------------------------------------------------------- #
+# Keyboard controls: key -> handler(state, world), looked up once per event
+# --------------------------------------------------------------------- #
+
+
+def _key_quit(state, world):
+    state["running"] = False
+
+
+def _key_reset(state, world):
+    print("Resetting world...")
+    world.reset()
+
+
+def _change_speed(state, delta):
+    state["sim_speed"] = clamp(state["sim_speed"] + delta, 0.1, 10.0)
+    print(f"Speed = {state['sim_speed']:.1f}x")
+
+
+def _key_faster(state, world):
+    _change_speed(state, 0.1)
+
+
+def _key_slower(state, world):
+    _change_speed(state, -0.1)
+
+
+KEY_ACTIONS = {
+    pygame.K_ESCAPE: _key_quit,
+    pygame.K_r: _key_reset,
+    pygame.K_EQUALS: _key_faster,
+    pygame.K_PLUS: _key_faster,
+    pygame.K_MINUS: _key_slower,
+}
 
 
 def main():
@@ -114,6 +238,12 @@ def main():
     screen = pygame.display.set_mode((WORLD_WIDTH, WORLD_HEIGHT))
     clock = pygame.time.Clock()
 
+    # Static background (fill + grid) rendered once, blitted every frame
+    background = pygame.Surface((WORLD_WIDTH, WORLD_HEIGHT)).convert()
+    background.fill(BG_COLOR)
+    if DRAW_GRID:
+        draw_grid(background)
+
     rng = random.Random(12345)
 
     # World + logger
@@ -121,53 +251,42 @@ def main():
     world.reset()
     logger = Logger()
 
-    running = True
-    sim_speed = 1.0  # multiplier for dt (can speed up/slow down simulation)
+    state = {
+        "running": True,
+        "sim_speed": 1.0,  # multiplier for dt (can speed up/slow down simulation)
+    }
 
-    while running:
+    while state["running"]:
         dt = clock.tick(FPS) / 1000.0
-        dt *= sim_speed
+        dt *= state["sim_speed"]
 
         # Handle events / keyboard
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
-                running = False
+                state["running"] = False
 
             # Keyboard controls
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    running = False
-
-                elif event.key == pygame.K_r:
-                    print("Resetting world...")
-                    world.reset()
-
-                elif event.key == pygame.K_EQUALS or event.key == pygame.K_PLUS:
-                    sim_speed = clamp(sim_speed + 0.1, 0.1, 10.0)
-                    print(f"Speed = {sim_speed:.1f}x")
-
-                elif event.key == pygame.K_MINUS:
-                    sim_speed = clamp(sim_speed - 0.1, 0.1, 10.0)
-                    print(f"Speed = {sim_speed:.1f}x")
+            elif event.type == pygame.KEYDOWN:
+                action = KEY_ACTIONS.get(event.key)
+                if action is not None:
+                    action(state, world)
 
         # Update world
         world.step(dt)
 
-        # Logging
-        logger.maybe_print(world)
-        logger.log_csv(world)
+        # Logging (one clock read for both)
+        now = time.monotonic()
+        logger.maybe_print(world, now)
+        logger.log_csv(world, now)
 
         # Draw background
-        screen.fill(BG_COLOR)
-        if DRAW_GRID:
-            draw_grid(screen)
+        screen.blit(background, (0, 0))
 
         # Draw food
         draw_food(screen, world.foods)
 
         # Draw organisms
-        for o in world.orgs:
-            draw_organism(screen, o, DRAW_FOV)
+        draw_organisms(screen, world.orgs, DRAW_FOV)
 
         # Weather overlay
         draw_weather_overlay(screen, world.env)
@@ -175,6 +294,7 @@ def main():
         # Update screen
         pygame.display.flip()
 
+    logger.close()
     pygame.quit()
     sys.exit()
 
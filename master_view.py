@@ -1,6 +1,7 @@
 import math
 from typing import Optional
 
+import numpy as np
 import pygame
 
 from config import FOV_COLOR, TARGET_COLOR
@@ -13,10 +14,10 @@ def draw_fov(surface: pygame.Surface, agent) -> None:
     Assumes the agent exposes:
         - x, y              (position)
         - angle             (heading, radians)
-        - trait_fov_deg     (FOV in degrees)
+        - _fov_rad          (FOV in radians, kept in sync with trait_fov_deg)
         - trait_range       (max sensor range)
     """
-    fov_rad = math.radians(agent.trait_fov_deg) / 2.0
+    fov_rad = agent._fov_rad / 2.0
     x, y = float(agent.x), float(agent.y)
 
     left_ang = agent.angle - fov_rad
@@ -35,17 +36,15 @@ def draw_fov(surface: pygame.Surface, agent) -> None:
     pygame.draw.line(surface, FOV_COLOR, (x, y), left, 1)
     pygame.draw.line(surface, FOV_COLOR, (x, y), right, 1)
 
-    # arc between left and right
+    # arc between left and right: all points from one cos/sin pass
     steps = 24
-    pts = []
-    for i in range(steps + 1):
-        a = left_ang + (i / steps) * (right_ang - left_ang)
-        px = x + agent.trait_range * math.cos(a)
-        py = y + agent.trait_range * math.sin(a)
-        pts.append((px, py))
-
-    if len(pts) >= 2:
-        pygame.draw.aalines(surface, FOV_COLOR, False, pts, 1)
+    a = np.linspace(left_ang, right_ang, steps + 1)
+    pts = np.column_stack(
+        (x + agent.trait_range * np.cos(a), y + agent.trait_range * np.sin(a))
+    ).tolist()
+
+    # plain 1-px lines: the AA path costs far more and is invisible at this size
+    pygame.draw.lines(surface, FOV_COLOR, False, pts, 1)
 
 
 def draw_target(surface: pygame.Surface, agent) -> None:
@@ -1,13 +1,14 @@
 import math
 import random
 from collections import deque
-from typing import Optional, Tuple, Set
+from typing import List, Optional, Tuple, Set
 
 import numpy as np
 import torch
 
 from brain import Brain
-from vision import torus_delta, raycast_cone
+from vision import torus_delta, cone_strengths, cone_strengths_many
+from spatial import CellBins
 from genetics import inherit_traits, mutate_val
 from config import (
     WORLD_WIDTH,
@@ -19,7 +20,6 @@ from config import (
     MAX_SPEED,
     SENSOR_RANGE_DEFAULT,
     SENSOR_FOV_DEG_DEFAULT,
-    SENSOR_RAYS,
     START_ENERGY,
     METABOLISM_BASE,
     METABOLISM_SPEED_COEF,
@@ -29,9 +29,6 @@ from config import (
     REPRODUCTION_THRESHOLD,
     PARENT_KEEP,
     CHILD_TAKE,
-    SEXUAL_REPRODUCTION,
-    MATING_RADIUS,
-    MATING_DRIVE_STRENGTH,
     MAX_AGE,
     MASTER_TRAIL_POINTS,
     # brain/dev
@@ -63,6 +60,101 @@ from config import (
     META_MAX,
 )
 
+# Numeric per-organism state kept in one float64 vector (an OrganismPool column
+# when attached); order = row order in OrganismPool.state.
+_STATE_FIELDS = (
+    "x",
+    "y",
+    "vx",
+    "vy",
+    "angle",
+    "ang_vel",
+    "energy",
+    "age",
+    "trait_fov_deg",
+    "trait_range",
+    "trait_thrust_eff",
+    "trait_metabolism_eff",
+    "trail_count",
+)
+
+
+class _StateField:
+    """Float attribute stored in element `k` of the owner's `_state` vector."""
+
+    __slots__ = ("k",)
+
+    def __init__(self, name: str) -> None:
+        self.k = _STATE_FIELDS.index(name)
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        return obj._state.item(self.k)
+
+    def __set__(self, obj, value) -> None:
+        obj._state[self.k] = value
+
+
+class _FovField(_StateField):
+    """trait_fov_deg, also keeping its radians in `_fov_rad` for sense()/draw_fov()."""
+
+    __slots__ = ()
+
+    def __set__(self, obj, value) -> None:
+        obj._state[self.k] = value
+        obj._fov_rad = math.radians(value)
+
+
+def metabolism_rate(speed, metabolism_eff, brain_tick: bool = True):
+    """
+    Energy cost per second for a given speed and metabolism trait.
+
+    Works on floats (per-organism path) and on NumPy arrays (World batch).
+    """
+    cost = METABOLISM_BASE * metabolism_eff
+    cost = cost + METABOLISM_SPEED_COEF * speed * metabolism_eff
+    if brain_tick:
+        cost = cost + METABOLISM_BRAIN_COEF
+    return cost
+
+
+def dev_learning_scale(age):
+    """
+    Younger organisms learn more; older ones less (sigmoid-ish).
+
+    Works on floats (per-organism path) and on NumPy arrays (World batch).
+    """
+    base = 1.0 / (1.0 + age / max(DEV_LEARNING_AGE_HALF, 1e-6))  # decays from 1 -> ~0
+    return DEV_LEARNING_MIN + (1.0 - DEV_LEARNING_MIN) * base
+
+
+def reflex_shape(left, right, turn_out, thrust_out):
+    """
+    Reflex assist: steer toward the stronger side and keep moving when food is seen.
+
+    Works on floats (per-organism path) and on NumPy arrays (World batch).
+    """
+    conf = np.maximum(left, right)
+    turn_out = np.where(np.abs(left - right) < 0.08, turn_out * 0.4, turn_out)
+    thrust_out = np.maximum(thrust_out, np.minimum(1.0, 0.25 + 0.75 * conf))
+    steer = right - left
+    turn_out = 0.7 * turn_out + 0.3 * steer
+    return turn_out, thrust_out
+
+
+def state_columns(orgs: List["Organism"], *names: str) -> List[np.ndarray]:
+    """
+    One NumPy array per numeric state field, row i belonging to orgs[i] (non-empty).
+
+    Pooled organisms are read straight from their OrganismPool columns.
+    """
+    pool = orgs[0]._pool
+    if pool is not None and all(o._pool is pool for o in orgs):
+        idx = pool.slots(orgs)
+        return [getattr(pool, name)[idx] for name in names]
+    return list(np.array([[getattr(o, name) for name in names] for o in orgs]).T)
+
 
 class Organism:
     """
@@ -76,6 +168,22 @@ class Organism:
 
     _next_id = 0
 
+    # numeric state lives in self._state (see OrganismPool)
+    x = _StateField("x")
+    y = _StateField("y")
+    vx = _StateField("vx")
+    vy = _StateField("vy")
+    angle = _StateField("angle")
+    ang_vel = _StateField("ang_vel")
+    energy = _StateField("energy")
+    age = _StateField("age")
+    trait_fov_deg = _FovField("trait_fov_deg")
+    trait_range = _StateField("trait_range")
+    trait_thrust_eff = _StateField("trait_thrust_eff")
+    trait_metabolism_eff = _StateField("trait_metabolism_eff")
+    # positions ever written to the trail ring buffer (float, like all state)
+    _trail_count = _StateField("trail_count")
+
     def __init__(
         self,
         x: float,
@@ -99,24 +207,32 @@ class Organism:
         self.parents: Tuple[int, ...] = parents if parents is not None else tuple()
         self.dependents: Set[int] = set()  # ids of children depending on this organism
 
+        # own state vector until an OrganismPool attaches us
+        self._state: np.ndarray = np.zeros(len(_STATE_FIELDS), dtype=np.float64)
+        self._pool: Optional["OrganismPool"] = None
+        self._slot: int = -1
+
         # position / motion
-        self.x: float = x
-        self.y: float = y
-        self.angle: float = angle if angle is not None else random.uniform(0.0, 2 * math.pi)
-        self.vx: float = 0.0
-        self.vy: float = 0.0
-        self.ang_vel: float = 0.0
+        self.x = x
+        self.y = y
+        self.angle = angle if angle is not None else random.uniform(0.0, 2 * math.pi)
+        self.vx = 0.0
+        self.vy = 0.0
+        self.ang_vel = 0.0
 
         # energy / life
-        self.energy: float = energy
-        self.age: float = 0.0
+        self.energy = energy
+        self.age = 0.0
         self.alive: bool = True
 
         # traits
-        self.trait_fov_deg: float = fov_deg
-        self.trait_range: float = rng_len
-        self.trait_thrust_eff: float = thrust_eff
-        self.trait_metabolism_eff: float = metabolism_eff
+        self.trait_fov_deg = fov_deg  # also sets _fov_rad
+        self.trait_range = rng_len
+        self.trait_thrust_eff = thrust_eff
+        self.trait_metabolism_eff = metabolism_eff
+        # traits are fixed for life, so metabolism_rate()'s per-organism terms are too
+        self._meta_base: float = METABOLISM_BASE * metabolism_eff
+        self._meta_speed_coef: float = METABOLISM_SPEED_COEF * metabolism_eff
 
         # sex
         self.sex: str = sex if sex in ("M", "F") else ("M" if random.random() < 0.5 else "F")
@@ -125,72 +241,98 @@ class Organism:
         self.brain: Brain = brain if brain is not None else Brain()
         self.last_inputs = None
         self.last_outputs = None
+        # reused input buffer for the per-organism path; bias slot is constant.
+        # float32 like the brain weights, so forward() needs no cast.
+        self._x_buf: np.ndarray = np.zeros(6, dtype=np.float32)
+        self._x_buf[5] = 1.0
 
         # sleep / dreams
         self.awake: bool = True
         self.sleep_pressure: float = 0.0
         self.dream_timer: float = 0.0
         self.memory: deque = deque(maxlen=MEMORY_BUFFER_SIZE)
+        # sampled replays awaiting World's batched dream pass
+        self.pending_dreams: Optional[Tuple[np.ndarray, np.ndarray]] = None
 
         # home / nurture hooks
         self.home_pos: Optional[Tuple[float, float]] = None
 
-        # visuals
-        self.trail: deque = deque(maxlen=MASTER_TRAIL_POINTS)
+        # visuals: ring buffer of recent positions (a view into the pool's
+        # trail_xy when attached); read it through .trail
+        self._trail: np.ndarray = np.empty((MASTER_TRAIL_POINTS, 2), dtype=np.float64)
         self.last_seen_target = None
 
+    @property
+    def trail(self) -> np.ndarray:
+        """The last MASTER_TRAIL_POINTS positions, oldest first: a fresh [n, 2] array."""
+        return np.concatenate(self.trail_runs())
+
+    def trail_runs(self) -> Tuple[np.ndarray, ...]:
+        """
+        The same points as `trail` without a copy: one or two [k, 2] views of
+        the ring buffer, oldest first. With two, the trail runs from the end
+        of the first straight into the start of the second.
+        """
+        n = int(self._trail_count)
+        if n <= MASTER_TRAIL_POINTS:
+            return (self._trail[:n],)
+        head = n % MASTER_TRAIL_POINTS
+        if head == 0:
+            return (self._trail,)
+        return (self._trail[head:], self._trail[:head])
+
     # ------------------------------------------------------------------ #
     # Core dynamics
     # ------------------------------------------------------------------ #
 
-    def sense(self, foods) -> tuple[float, float]:
+    def sense(self, foods, heading: Optional[Tuple[float, float]] = None) -> tuple[float, float]:
         """
-        Cast a cone of SENSOR_RAYS rays within FOV and compute
-        left/right sensor activations based on food hits.
+        Cast a cone within FOV and compute left/right sensor activations
+        based on food hits (nearer = stronger).
+
+        `foods` is the World's FoodStore (its `xy` mirror is used directly) or
+        any sequence of objects with .x/.y. `heading` is (cos, sin) of the
+        current angle if the caller has them already.
         """
-        if not foods:
+        if not len(foods):
             return 0.0, 0.0
 
-        left_val = 0.0
-        right_val = 0.0
+        food_xy = getattr(foods, "xy32", None)
+        if food_xy is None:
+            food_xy = np.array([(f.x, f.y) for f in foods], dtype=np.float32)
 
         # Use current trait FOV/range
-        fov_rad = math.radians(self.trait_fov_deg)
-        max_dist = self.trait_range
-
-        hits = raycast_cone(
+        return cone_strengths(
             self.x,
             self.y,
             self.angle,
-            fov_rad,
-            max_dist,
-            SENSOR_RAYS,
-            foods,
+            self._fov_rad,
+            self.trait_range,
+            food_xy,
+            heading,
         )
 
-        for hit_angle, dist in hits:
-            if dist <= 0.0 or dist > max_dist:
-                continue
-            # nearer = stronger
-            strength = max(0.0, 1.0 - dist / max_dist)
-            if hit_angle < 0:
-                left_val = max(left_val, strength)
-            else:
-                right_val = max(right_val, strength)
-
-        return left_val, right_val
-
-    def physics_step(self, dt: float, thrust_norm: float, turn_norm: float) -> float:
+    def physics_step(
+        self,
+        dt: float,
+        thrust_norm: float,
+        turn_norm: float,
+        heading: Optional[Tuple[float, float]] = None,
+    ) -> float:
         """
         Integrate physics for dt seconds.
         Returns speed magnitude after the update.
+
+        :param heading: (cos, sin) of the current angle, if already computed
+                        this tick (step() shares them with sense()).
         """
         # thrust_norm in [0,1]; scale by trait + BASE_THRUST
         thrust = thrust_norm * BASE_THRUST * self.trait_thrust_eff
 
         # forward acceleration
-        ax = math.cos(self.angle) * thrust
-        ay = math.sin(self.angle) * thrust
+        ca, sa = heading if heading is not None else (math.cos(self.angle), math.sin(self.angle))
+        ax = ca * thrust
+        ay = sa * thrust
 
         # apply drag
         ax -= LIN_DRAG * self.vx
@@ -212,23 +354,24 @@ class Organism:
         torque = turn_norm * MAX_TURN_TORQUE
         ang_acc = torque - ANG_DRAG * self.ang_vel
         self.ang_vel += ang_acc * dt
-        self.angle = (self.angle + self.ang_vel * dt) % (2 * math.pi)
+        self.angle = (self.angle + self.ang_vel * dt) % math.tau
 
         # integrate position with wrap-around (torus)
         self.x = (self.x + self.vx * dt) % WORLD_WIDTH
         self.y = (self.y + self.vy * dt) % WORLD_HEIGHT
 
         # update trail
-        self.trail.append((self.x, self.y))
+        n = self._trail_count
+        self._trail[int(n) % MASTER_TRAIL_POINTS] = (self.x, self.y)
+        self._trail_count = n + 1.0
 
         return speed
 
     def metabolism_cost(self, speed: float, brain_tick: bool = True) -> float:
         """
-        Energy cost per second.
+        Energy cost per second; metabolism_rate() with the trait terms cached.
         """
-        cost = METABOLISM_BASE * self.trait_metabolism_eff
-        cost += METABOLISM_SPEED_COEF * speed * self.trait_metabolism_eff
+        cost = self._meta_base + self._meta_speed_coef * speed
         if brain_tick:
             cost += METABOLISM_BRAIN_COEF
         return cost
@@ -241,9 +384,7 @@ class Organism:
         """
         Younger organisms learn more; older ones less (sigmoid-ish).
         """
-        a = self.age / max(DEV_LEARNING_AGE_HALF, 1e-6)
-        base = 1.0 / (1.0 + a)  # decays from 1 -> ~0 as age grows
-        return DEV_LEARNING_MIN + (1.0 - DEV_LEARNING_MIN) * base
+        return dev_learning_scale(self.age)
 
     def _dev_scaled_reward(self, reward: float) -> float:
         return reward * self._dev_learning_scale()
@@ -281,11 +422,29 @@ class Organism:
         # dream length 2–6 s depending on how tired we are
         self.dream_timer = 2.0 + 4.0 * min(1.0, self.sleep_pressure)
 
-    def _sleep_step(self, dt: float, env) -> bool:
+    def sample_dreams(self, steps: int) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Draw `steps` noisy replays from memory in one go.
+
+        Returns (inputs [steps, in_size], rewards [steps]) or None if there is
+        nothing to dream about.
+        """
+        if steps <= 0 or not self.memory:
+            return None
+        picks = random.choices(self.memory, k=steps)
+        x = np.stack([p[0] for p in picks])
+        x += np.random.normal(0.0, 0.05, size=x.shape)
+        rewards = np.array([p[2] for p in picks], dtype=float)
+        return x, rewards
+
+    def _sleep_step(self, dt: float, env, defer_dreams: bool = False) -> bool:
         """
         Called instead of normal awake step when organism is sleeping.
         No movement, reduced metabolism, and dream replay learning.
         Returns ate=False always (no food while sleeping).
+
+        With `defer_dreams` the replay is only sampled into `pending_dreams`;
+        World.step() then replays every sleeper's dreams in lockstep batches.
         """
         if self.energy <= 0.0:
             self.alive = False
@@ -297,15 +456,17 @@ class Organism:
         self.age += dt
 
         # dream replay: multiple mini-steps per second of sleep
+        # (age is fixed for the whole replay, so is the learning scale)
         dream_steps = int(DREAM_STEPS_PER_SEC * dt)
-        for _ in range(dream_steps):
-            if not self.memory:
-                break
-            x_vec, action_vec, reward = random.choice(self.memory)
-            noisy_x = x_vec + np.random.normal(0.0, 0.05, size=x_vec.shape)
-            # forward without moving body; ignore outputs
-            self.brain.forward(noisy_x)
-            self.brain.apply_plasticity(self._dev_scaled_reward(reward))
+        dreams = self.sample_dreams(dream_steps)
+        if defer_dreams:
+            self.pending_dreams = dreams
+        elif dreams is not None:
+            dev_scale = self._dev_learning_scale()
+            for noisy_x, reward in zip(*dreams):
+                # forward without moving body; ignore outputs
+                self.brain.forward(noisy_x)
+                self.brain.apply_plasticity(float(reward) * dev_scale)
 
         # recover sleep pressure
         self.sleep_pressure = max(0.0, self.sleep_pressure - SLEEP_RECOVERY_RATE * dt)
@@ -323,98 +484,166 @@ class Organism:
     # Main step
     # ------------------------------------------------------------------ #
 
-    def step(self, dt: float, foods, rng: random.Random, env=None) -> bool:
+    def brain_inputs(
+        self,
+        foods,
+        out: Optional[np.ndarray] = None,
+        heading: Optional[Tuple[float, float]] = None,
+    ) -> np.ndarray:
+        """
+        Sense the world and build this tick's brain input vector
+        [left, right, energy, speed, age, bias].
+
+        Per-organism path; World.step() builds the same vectors for every awake
+        organism at once with OrganismPool.brain_inputs().
+        """
+        left, right = self.sense(foods, heading)
+
+        energy_norm = max(0.0, min(1.0, self.energy / (REPRODUCTION_THRESHOLD + 1.0)))
+        speed_now = math.hypot(self.vx, self.vy)
+        speed_norm = min(1.0, speed_now / MAX_SPEED)
+        age_norm = min(1.0, self.age / MAX_AGE)
+        if out is None:
+            # overwritten next tick; step() copies it into memory
+            out = self._x_buf
+        else:
+            out[5] = 1.0
+        out[0] = left
+        out[1] = right
+        out[2] = energy_norm
+        out[3] = speed_norm
+        out[4] = age_norm
+        return out
+
+    def step(
+        self,
+        dt: float,
+        foods,
+        rng: random.Random,
+        env=None,
+        defer_dreams: bool = False,
+    ) -> bool:
         """
-        Advance organism by dt seconds.
+        Advance organism by dt seconds on its own: sense, think, move, eat, learn.
+
+        World.step() runs the same awake tick for the whole population at once
+        (see OrganismPool) and only calls this for sleepers.
 
         :param dt:   timestep in seconds.
         :param foods: list of Food objects.
         :param rng:  random.Random instance.
         :param env:  Environment (for day/night factor, etc.).
+        :param defer_dreams: when sleeping, leave dream replay to World.step()
+                             (see _sleep_step).
         :return: True if ate this step, False otherwise.
         """
         if not self.alive:
             return False
 
-        energy_before = self.energy
-
         # If sleeping, run sleep logic
         if not self.awake:
-            return self._sleep_step(dt, env)
+            return self._sleep_step(dt, env, defer_dreams)
 
-        # ===== SENSE =====
-        left, right = self.sense(foods)
+        # Pooled fields are read into locals once and written back once below
+        # (brain and physics never touch energy/age)
+        energy = energy_before = self.energy
+        age = self.age
 
-        # ===== BRAIN I/O =====
-        energy_norm = max(0.0, min(1.0, self.energy / (REPRODUCTION_THRESHOLD + 1.0)))
-        speed_now = math.hypot(self.vx, self.vy)
-        speed_norm = min(1.0, speed_now / MAX_SPEED)
-        age_norm = min(1.0, self.age / MAX_AGE)
-        x_vec = np.array(
-            [left, right, energy_norm, speed_norm, age_norm, 1.0],
-            dtype=float,
-        )
+        # Heading is fixed until physics turns us: one cos/sin for sense and thrust
+        angle = self.angle
+        heading = (math.cos(angle), math.sin(angle))
 
+        # ===== SENSE + BRAIN I/O =====
+        x_vec = self.brain_inputs(foods, heading=heading)
         turn_out, thrust_out = self.brain.forward(x_vec)
+        left, right = x_vec[:2].tolist()
 
-        # record inputs/outputs before reflex shaping
-        self.last_inputs = (left, right, energy_norm, speed_norm, age_norm)
-
+        # ===== REFLEX + PHYSICS =====
         # --- reflex assist (steer toward stronger signal) ---
-        conf = max(left, right)
-        if abs(left - right) < 0.08:
-            turn_out *= 0.4
-        thrust_out = max(thrust_out, min(1.0, 0.25 + 0.75 * conf))
-        steer = (right - left)
-        turn_out = 0.7 * turn_out + 0.3 * steer
-
-        self.last_outputs = (turn_out, thrust_out)
-
-        # ===== PHYSICS =====
-        speed = self.physics_step(dt, thrust_out, turn_out)
+        turn_out, thrust_out = (
+            float(v) for v in reflex_shape(left, right, turn_out, thrust_out)
+        )
+        speed = self.physics_step(dt, thrust_out, turn_out, heading)
+        cost = self.metabolism_cost(speed, brain_tick=True)
 
         # ===== EAT =====
-        ate = False
-        for f in list(foods):
-            dx, dy = torus_delta(self.x, self.y, f.x, f.y)
-            if dx * dx + dy * dy <= EAT_RADIUS * EAT_RADIUS:
-                self.energy += FOOD_ENERGY
-                foods.remove(f)
-                ate = True
-                break
+        ate = self.eat(foods)
+        if ate:
+            energy += FOOD_ENERGY
 
         # ===== ENERGY UPDATE =====
-        self.energy -= self.metabolism_cost(speed, brain_tick=True) * dt
+        energy -= cost * dt
 
         # senescence
-        if self.age > MAX_AGE:
-            self.energy -= 0.02 * (self.age - MAX_AGE) * dt
+        if age > MAX_AGE:
+            energy -= 0.02 * (age - MAX_AGE) * dt
 
-        self.age += dt
-        if self.energy <= 0.0:
+        self.energy = energy
+        self.age = age + dt
+        if energy <= 0.0:
             self.alive = False
 
         # ===== REWARD & LEARNING =====
-        reward = self.energy - energy_before
+        reward = energy - energy_before
         reward = max(-1.0, min(1.0, reward))
 
-        # log experience for later dreaming
-        self.memory.append(
-            (
-                x_vec.copy(),
-                np.array([turn_out, thrust_out], dtype=float),
-                reward,
-            )
+        self.record_tick(
+            x_vec.copy(), np.array([turn_out, thrust_out], dtype=np.float32), reward, dt, env
         )
 
         # online plasticity
         self.brain.apply_plasticity(self._dev_scaled_reward(reward))
 
-        # sleep pressure update
-        self._update_sleep_pressure(dt, env)
-
         return ate
 
+    def eat(self, foods) -> bool:
+        """
+        Remove the first food within EAT_RADIUS, if any; the caller credits FOOD_ENERGY.
+
+        :param foods: the World's FoodStore, or a plain list of Food objects.
+        :return: True if something was eaten.
+        """
+        px, py = self.x, self.y
+        eat_r2 = EAT_RADIUS * EAT_RADIUS
+        if hasattr(foods, "near"):
+            # FoodStore: only the handful of foods in its grid cells around us
+            for i in foods.near(px, py):
+                f = foods[i]
+                dx, dy = torus_delta(px, py, f.x, f.y)
+                if dx * dx + dy * dy <= eat_r2:
+                    foods.pop_swap(i)
+                    return True
+            return False
+        for i, f in enumerate(foods):
+            dx, dy = torus_delta(px, py, f.x, f.y)
+            if dx * dx + dy * dy <= eat_r2:
+                # swap-with-last pop: O(1), list order isn't relied on
+                foods[i] = foods[-1]
+                foods.pop()
+                return True
+        return False
+
+    def record_tick(
+        self,
+        x_vec: np.ndarray,
+        action: np.ndarray,
+        reward: float,
+        dt: float,
+        env=None,
+    ) -> None:
+        """
+        End of an awake tick: keep inputs/outputs, log the experience for
+        later dreaming and build up sleep pressure.
+
+        :param x_vec:  float32 brain inputs (6,), stored in memory as is.
+        :param action: float32 (turn, thrust) after reflex shaping, stored as is.
+                       Neither may be reused by the caller afterwards.
+        """
+        self.last_inputs = tuple(x_vec[:5].tolist())
+        self.last_outputs = tuple(action.tolist())
+        self.memory.append((x_vec, action, reward))
+        self._update_sleep_pressure(dt, env)
+
     # ------------------------------------------------------------------ #
     # Reproduction
     # ------------------------------------------------------------------ #
@@ -422,9 +651,17 @@ class Organism:
     def can_reproduce(self) -> bool:
         return self.energy >= REPRODUCTION_THRESHOLD and self.alive
 
-    def reproduce_asexual(self, rng: random.Random) -> "Organism":
+    def reproduce_asexual(
+        self,
+        rng: random.Random,
+        traits: Optional[Tuple[float, float, float, float]] = None,
+    ) -> "Organism":
         """
         Asexual reproduction: single parent buds off a mutated child.
+
+        `traits` lets the caller supply already-mutated child traits
+        (e.g. from genetics.inherit_traits_batch); otherwise they are
+        inherited from this parent here.
         """
         child_energy = self.energy * CHILD_TAKE
         self.energy *= PARENT_KEEP
@@ -435,7 +672,9 @@ class Organism:
         if rng.random() < 0.5:
             child_brain.w_in[[0, 1], :] = child_brain.w_in[[1, 0], :]
 
-        fov_deg, rng_len, thrust_eff, meta_eff = inherit_traits(self, rng)
+        if traits is None:
+            traits = inherit_traits(self, rng)
+        fov_deg, rng_len, thrust_eff, meta_eff = traits
         child = Organism(
             x=(self.x + rng.uniform(-4, 4)) % WORLD_WIDTH,
             y=(self.y + rng.uniform(-4, 4)) % WORLD_HEIGHT,
@@ -481,15 +720,20 @@ class Organism:
         child_energy = ea + eb
 
         # Brain recombination: simple averaging + mutation
-        with torch.no_grad():
-            w_in = 0.5 * (parent_a.brain.w_in + parent_b.brain.w_in)
-            w_rec = 0.5 * (parent_a.brain.w_rec + parent_b.brain.w_rec)
-            b_h = 0.5 * (parent_a.brain.b_h + parent_b.brain.b_h)
-            w_out = 0.5 * (parent_a.brain.w_out + parent_b.brain.w_out)
-            b_out = 0.5 * (parent_a.brain.b_out + parent_b.brain.b_out)
+        pool = parent_a.brain._pool
+        if pool is not None and parent_b.brain._pool is pool:
+            # straight into a pool row, mutated with the pool's seeded generator
+            child_brain = pool.crossover_mutated(parent_a.brain, parent_b.brain)
+        else:
+            with torch.no_grad():
+                w_in = 0.5 * (parent_a.brain.w_in + parent_b.brain.w_in)
+                w_rec = 0.5 * (parent_a.brain.w_rec + parent_b.brain.w_rec)
+                b_h = 0.5 * (parent_a.brain.b_h + parent_b.brain.b_h)
+                w_out = 0.5 * (parent_a.brain.w_out + parent_b.brain.w_out)
+                b_out = 0.5 * (parent_a.brain.b_out + parent_b.brain.b_out)
 
-        child_brain = Brain(params=(w_in, w_rec, b_h, w_out, b_out))
-        child_brain = child_brain.copy_mutated()
+            child_brain = Brain(params=(w_in, w_rec, b_h, w_out, b_out))
+            child_brain = child_brain.copy_mutated()
 
         # 50% swap LR channels for symmetry
         if rng.random() < 0.5:
@@ -593,3 +837,317 @@ class Organism:
         transfer = surplus * PARENT_FEED_SHARE
         self.energy -= transfer
         child.energy += transfer
+
+
+class OrganismPool:
+    """
+    Structure-of-arrays storage for the numeric state of a whole population.
+
+    `state` is [len(_STATE_FIELDS), capacity] float64: one contiguous array per
+    field (pool.x, pool.vx, pool.energy, ... are its row views). An attached
+    Organism's `_state` is a view onto its column, so every per-organism
+    attribute access reads and writes the pool directly while physics_step()
+    integrates any subset of organisms with a handful of NumPy operations.
+    Trails live alongside in `trail_xy` [capacity, MASTER_TRAIL_POINTS, 2],
+    one ring buffer per column, with `Organism._trail` a view likewise.
+
+    Mirrors BrainPool: capacity doubles on demand; freed columns are recycled.
+    """
+
+    def __init__(self, capacity: int = 64) -> None:
+        self.capacity = 0
+        self.state = np.zeros((len(_STATE_FIELDS), 0), dtype=np.float64)
+        self.trail_xy = np.empty((0, MASTER_TRAIL_POINTS, 2), dtype=np.float64)
+        self._orgs: List[Optional[Organism]] = []
+        self._free: List[int] = []
+        self._grow(capacity)
+
+    def __len__(self) -> int:
+        return self.capacity - len(self._free)
+
+    # ----------------------------------------------------------------- #
+    # Membership
+    # ----------------------------------------------------------------- #
+
+    def attach(self, org: Organism) -> None:
+        """
+        Copy `org`'s state into a free column and rebind it to a view of that column.
+        No-op if the organism already lives in this pool.
+        """
+        if org._pool is self:
+            return
+        if org._pool is not None:
+            org._pool.release(org)
+
+        slot = self._alloc_slot()
+        self.state[:, slot] = org._state
+        self.trail_xy[slot] = org._trail
+        self._bind(org, slot)
+
+    def release(self, org: Organism) -> None:
+        """
+        Give `org` a private copy of its state and free its column for reuse.
+        """
+        if org._pool is not self:
+            return
+        org._state = org._state.copy()
+        org._trail = org._trail.copy()
+        self._orgs[org._slot] = None
+        self._free.append(org._slot)
+        org._pool = None
+        org._slot = -1
+
+    def slots(self, orgs: List[Organism]) -> np.ndarray:
+        """Column indices of `orgs` (all attached here), for fancy-indexing field arrays."""
+        return np.fromiter((o._slot for o in orgs), dtype=np.intp, count=len(orgs))
+
+    def _alloc_slot(self) -> int:
+        if not self._free:
+            self._grow(2 * self.capacity)
+        return self._free.pop()
+
+    def _bind(self, org: Organism, slot: int) -> None:
+        org._state = self.state[:, slot]
+        org._trail = self.trail_xy[slot]
+        org._pool = self
+        org._slot = slot
+        self._orgs[slot] = org
+
+    def _grow(self, capacity: int) -> None:
+        """Reallocate `state` with `capacity` columns and rebind member views."""
+        old = self.capacity
+        grown = np.zeros((len(_STATE_FIELDS), capacity), dtype=np.float64)
+        grown[:, :old] = self.state
+        self.state = grown
+        for k, name in enumerate(_STATE_FIELDS):
+            setattr(self, name, grown[k])
+        trail_xy = np.empty((capacity, MASTER_TRAIL_POINTS, 2), dtype=np.float64)
+        trail_xy[:old] = self.trail_xy
+        self.trail_xy = trail_xy
+
+        self.capacity = capacity
+        self._orgs.extend([None] * (capacity - old))
+        # pop() hands out low slots first
+        self._free.extend(range(capacity - 1, old - 1, -1))
+        for slot in range(old):
+            org = self._orgs[slot]
+            if org is not None:
+                self._bind(org, slot)
+
+    # ----------------------------------------------------------------- #
+    # Batched sensing / physics
+    # ----------------------------------------------------------------- #
+
+    def heading(self, orgs: List[Organism]) -> Tuple[np.ndarray, np.ndarray]:
+        """(cos, sin) of every organism's angle, for brain_inputs() and physics_step()."""
+        angle = self.angle[self.slots(orgs)]
+        return np.cos(angle), np.sin(angle)
+
+    def brain_inputs(
+        self,
+        orgs: List[Organism],
+        foods,
+        out: np.ndarray,
+        heading: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+    ) -> np.ndarray:
+        """
+        Organism.brain_inputs() for many pooled organisms, written into `out` [N, 6].
+
+        Body-state inputs are computed column-wise. Sensing is a broadphase over
+        the FoodStore's position mirrors: food is binned into cells at least as large
+        as the longest sensor range, and each organism sees only the 3x3 cells
+        around its own. The per-cell candidate lists are padded into one
+        [N, K] table so the whole population goes through a single
+        cone_strengths_many() call.
+        """
+        idx = self.slots(orgs)
+
+        out[:, 2] = np.clip(self.energy[idx] / (REPRODUCTION_THRESHOLD + 1.0), 0.0, 1.0)
+        out[:, 3] = np.minimum(1.0, np.hypot(self.vx[idx], self.vy[idx]) / MAX_SPEED)
+        out[:, 4] = np.minimum(1.0, self.age[idx] / MAX_AGE)
+        out[:, 5] = 1.0
+
+        # bin on exact positions, sense on float32 ones
+        if hasattr(foods, "xy32"):
+            food_xy, food_xy32 = foods.xy, foods.xy32
+        else:
+            food_xy = np.array([(f.x, f.y) for f in foods], dtype=np.float64)
+            food_xy32 = food_xy.astype(np.float32)
+        x, y = self.x[idx], self.y[idx]
+        angle = self.angle[idx]
+        fov_rad = np.radians(self.trait_fov_deg[idx])
+        rng_len = self.trait_range[idx]
+
+        out[:, :2] = 0.0
+        if len(food_xy) and len(orgs):
+            bins = CellBins(food_xy, max(float(rng_len.max()), 1.0))
+            cells, row_of = np.unique(bins.cell_ids(x, y), return_inverse=True)
+            index, valid = bins.near_padded(cells)
+
+            # organisms with no food in the 3x3 cells around them see nothing:
+            # leave their zeros and keep them out of the [N, K] block
+            rows = np.flatnonzero(valid.any(axis=1)[row_of])
+            if len(rows) < len(orgs):
+                row_of = row_of[rows]
+                x, y, angle = x[rows], y[rows], angle[rows]
+                fov_rad, rng_len = fov_rad[rows], rng_len[rows]
+                if heading is not None:
+                    heading = (heading[0][rows], heading[1][rows])
+            if len(rows):
+                out[rows, :2] = cone_strengths_many(
+                    x,
+                    y,
+                    angle,
+                    fov_rad,
+                    rng_len,
+                    food_xy32[index[row_of]],
+                    valid[row_of],
+                    heading,
+                )
+        return out
+
+    def physics_step(
+        self,
+        orgs: List[Organism],
+        dt: float,
+        thrust_norm: np.ndarray,
+        turn_norm: np.ndarray,
+        heading: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Organism.physics_step() for many pooled organisms at once.
+
+        :param orgs:        N organisms attached to this pool.
+        :param thrust_norm: NumPy (N,) thrust commands in [0, 1].
+        :param turn_norm:   NumPy (N,) turn commands in [-1, 1].
+        :param heading:     (cos, sin) of their angles from heading(), if the
+                            caller already shared them with brain_inputs().
+        :return: NumPy (N,) speed magnitudes after the update and the matching
+                 (N,) awake metabolism cost per second.
+        """
+        idx = self.slots(orgs)
+
+        # thrust_norm in [0,1]; scale by trait + BASE_THRUST
+        thrust = thrust_norm * BASE_THRUST * self.trait_thrust_eff[idx]
+        angle = self.angle[idx]
+        vx = self.vx[idx]
+        vy = self.vy[idx]
+
+        # forward acceleration minus drag, then update velocity
+        ca, sa = heading if heading is not None else (np.cos(angle), np.sin(angle))
+        vx += (ca * thrust - LIN_DRAG * vx) * dt
+        vy += (sa * thrust - LIN_DRAG * vy) * dt
+
+        # clamp speed
+        speed = np.hypot(vx, vy)
+        over = speed > MAX_SPEED
+        if over.any():
+            scale = MAX_SPEED / np.maximum(speed[over], 1e-6)
+            vx[over] *= scale
+            vy[over] *= scale
+            speed[over] = MAX_SPEED
+
+        # angular dynamics
+        ang_vel = self.ang_vel[idx]
+        ang_vel += (turn_norm * MAX_TURN_TORQUE - ANG_DRAG * ang_vel) * dt
+        angle = (angle + ang_vel * dt) % math.tau
+
+        # integrate position with wrap-around (torus)
+        self.x[idx] = (self.x[idx] + vx * dt) % WORLD_WIDTH
+        self.y[idx] = (self.y[idx] + vy * dt) % WORLD_HEIGHT
+        self.vx[idx] = vx
+        self.vy[idx] = vy
+        self.ang_vel[idx] = ang_vel
+        self.angle[idx] = angle
+
+        # update trails (x, y are state rows 0, 1)
+        n = self.trail_count[idx]
+        self.trail_xy[idx, n.astype(np.intp) % MASTER_TRAIL_POINTS] = self.state[:2, idx].T
+        self.trail_count[idx] = n + 1.0
+        return speed, metabolism_rate(speed, self.trait_metabolism_eff[idx])
+
+    def in_eat_reach(self, orgs: List[Organism], food_xy: np.ndarray) -> np.ndarray:
+        """
+        For each organism, whether any food in `food_xy` [K, 2] lies within
+        EAT_RADIUS: Organism.eat()'s test for every (organism, food) pair in
+        one dense pass.
+
+        Only these rows can eat before new food appears, so the ordered eat
+        loop can skip everyone else.
+        """
+        if not len(food_xy) or not len(orgs):
+            return np.zeros(len(orgs), dtype=bool)
+        idx = self.slots(orgs)
+        dx = food_xy[:, 0] - self.x[idx, None]
+        dy = food_xy[:, 1] - self.y[idx, None]
+        dx -= WORLD_WIDTH * np.rint(dx * (1.0 / WORLD_WIDTH))
+        dy -= WORLD_HEIGHT * np.rint(dy * (1.0 / WORLD_HEIGHT))
+        return (dx * dx + dy * dy <= EAT_RADIUS * EAT_RADIUS).any(axis=1)
+
+    def metabolism_step(
+        self,
+        orgs: List[Organism],
+        dt: float,
+        cost: np.ndarray,
+        ate: np.ndarray,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Organism.step()'s energy/age update for many awake pooled organisms at once.
+
+        :param cost: NumPy (N,) metabolism cost per second from physics_step().
+        :param ate:  NumPy (N,) bool, who ate this tick.
+        :return: NumPy (N,) rewards clipped to [-1, 1] and (N,) bool of who starved.
+        """
+        idx = self.slots(orgs)
+        before = self.energy[idx]
+        energy = before + np.where(ate, FOOD_ENERGY, 0.0)
+        energy -= cost * dt
+
+        # senescence
+        age = self.age[idx]
+        old = age > MAX_AGE
+        energy[old] -= 0.02 * (age[old] - MAX_AGE) * dt
+
+        self.energy[idx] = energy
+        self.age[idx] = age + dt
+        return np.clip(energy - before, -1.0, 1.0), energy <= 0.0
+
+    def orphan_penalty(self, orgs: List[Organism], cared: List[int], dt: float) -> np.ndarray:
+        """
+        Small extra energy drain on every young organism no caregiver reached.
+
+        :param cared: pool slots of the children nurtured this tick.
+        :return: NumPy (N,) bool of who starved from it.
+        """
+        idx = self.slots(orgs)
+        orphan = self.age[idx] < CHILD_DEPENDENCY_AGE
+        orphan[np.isin(idx, cared)] = False
+        hit = idx[orphan]
+        self.energy[hit] -= (1.0 - ORPHAN_PENALTY) * 0.01 * dt
+        starved = np.zeros(len(orgs), dtype=bool)
+        starved[orphan] = self.energy[hit] <= 0.0
+        return starved
+
+    # ----------------------------------------------------------------- #
+    # Batched reproduction checks
+    # ----------------------------------------------------------------- #
+
+    def can_reproduce(self, orgs: List[Organism]) -> np.ndarray:
+        """Organism.can_reproduce() for many pooled organisms: NumPy (N,) bool."""
+        alive = np.fromiter((o.alive for o in orgs), dtype=bool, count=len(orgs))
+        return alive & (self.energy[self.slots(orgs)] >= REPRODUCTION_THRESHOLD)
+
+    def traits(self, orgs: List[Organism]) -> np.ndarray:
+        """
+        NumPy (N, 4) heritable traits (fov_deg, range, thrust_eff, metabolism_eff),
+        the layout inherit_traits_batch() takes.
+        """
+        idx = self.slots(orgs)
+        return np.column_stack(
+            (
+                self.trait_fov_deg[idx],
+                self.trait_range[idx],
+                self.trait_thrust_eff[idx],
+                self.trait_metabolism_eff[idx],
+            )
+        )
@@ -0,0 +1,207 @@
+# spatial.py
+"""
+Broad phases for short-range proximity queries on the torus.
+
+Keys (any hashable, usually list indices) are bucketed by cell; a query
+returns every key in the 3x3 block of cells around a point, so any key
+within `cell` distance of it is guaranteed to be included. Callers still
+do the exact distance test on the candidates.
+
+UniformGrid is updated incrementally; CellBins is rebuilt from a NumPy
+point array each tick. SweepBands is the sort-along-x alternative
+(sweep and prune) for a point set queried against itself.
+"""
+
+from typing import Dict, Hashable, Iterator, List, Tuple
+
+import numpy as np
+
+from config import WORLD_WIDTH, WORLD_HEIGHT
+
+Cell = Tuple[int, int]
+
+
+class UniformGrid:
+    def __init__(
+        self,
+        cell: float,
+        width: float = WORLD_WIDTH,
+        height: float = WORLD_HEIGHT,
+    ) -> None:
+        """
+        :param cell: minimum cell size (>= the largest query radius).
+        """
+        # Whole number of cells per axis so wrapped cells tile the torus exactly;
+        # the actual cell size is therefore >= `cell`.
+        self.nx = max(1, int(width // cell))
+        self.ny = max(1, int(height // cell))
+        self._inv_w = self.nx / width
+        self._inv_h = self.ny / height
+        self.buckets: Dict[Cell, List[Hashable]] = {}
+        # cell -> its 3x3 wrapped neighbourhood, filled in on first query
+        self._around: Dict[Cell, Tuple[Cell, ...]] = {}
+
+    def cell_of(self, x: float, y: float) -> Cell:
+        return int(x * self._inv_w) % self.nx, int(y * self._inv_h) % self.ny
+
+    def insert(self, key: Hashable, x: float, y: float) -> None:
+        self.buckets.setdefault(self.cell_of(x, y), []).append(key)
+
+    def remove(self, key: Hashable, x: float, y: float) -> None:
+        cell = self.cell_of(x, y)
+        bucket = self.buckets[cell]
+        bucket.remove(key)
+        if not bucket:
+            del self.buckets[cell]
+
+    def rekey(self, old: Hashable, new: Hashable, x: float, y: float) -> None:
+        """Rename a key in place (e.g. after a swap-pop moved its index)."""
+        bucket = self.buckets[self.cell_of(x, y)]
+        bucket[bucket.index(old)] = new
+
+    def clear(self) -> None:
+        self.buckets.clear()
+
+    def near(self, x: float, y: float) -> Iterator[Hashable]:
+        """Keys in the 3x3 cells around (x, y), each cell visited once."""
+        cell = self.cell_of(x, y)
+        around = self._around.get(cell)
+        if around is None:
+            cx, cy = cell
+            xs = {(cx + d) % self.nx for d in (-1, 0, 1)}
+            ys = {(cy + d) % self.ny for d in (-1, 0, 1)}
+            around = self._around[cell] = tuple((gx, gy) for gx in xs for gy in ys)
+        buckets = self.buckets
+        for c in around:
+            bucket = buckets.get(c)
+            if bucket:
+                yield from bucket
+
+
+class CellBins:
+    """
+    A fixed NumPy point set bucketed into uniform torus cells with one argsort.
+
+    The per-tick counterpart of UniformGrid: rebuilt from an [N, 2] array
+    instead of updated key by key. Points of cell c are
+    `order[starts[c]:starts[c + 1]]`, cells numbered row-major.
+    """
+
+    def __init__(
+        self,
+        xy: np.ndarray,
+        cell: float,
+        width: float = WORLD_WIDTH,
+        height: float = WORLD_HEIGHT,
+    ) -> None:
+        """
+        :param xy:   [N, 2] point positions inside the world.
+        :param cell: minimum cell size (>= the largest query radius).
+        """
+        self.nx = max(1, int(width // cell))
+        self.ny = max(1, int(height // cell))
+        self._inv_w = self.nx / width
+        self._inv_h = self.ny / height
+        ids = self.cell_ids(xy[:, 0], xy[:, 1])
+        self.order = np.argsort(ids, kind="stable")
+        self.starts = np.searchsorted(ids[self.order], np.arange(self.nx * self.ny + 1))
+
+    def cell_ids(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """Row-major cell number of every (x, y) pair."""
+        cx = (x * self._inv_w).astype(np.intp) % self.nx
+        cy = (y * self._inv_h).astype(np.intp) % self.ny
+        return cy * self.nx + cx
+
+    def near(self, cell_id: int) -> np.ndarray:
+        """Indices of the points in the 3x3 cells around `cell_id`, each cell once."""
+        cx, cy = cell_id % self.nx, cell_id // self.nx
+        xs = {(cx + d) % self.nx for d in (-1, 0, 1)}
+        ys = {(cy + d) % self.ny for d in (-1, 0, 1)}
+        if len(xs) == self.nx and len(ys) == self.ny:
+            return self.order
+        starts = self.starts
+        return np.concatenate(
+            [
+                self.order[starts[c] : starts[c + 1]]
+                for c in (gy * self.nx + gx for gy in ys for gx in xs)
+            ]
+        )
+
+    def near_padded(self, cell_ids: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        near() for several cells as one rectangular [M, K] index table.
+
+        Short rows are padded with index 0; `valid` [M, K] marks the real
+        entries. Lets a caller run one array op over every cell's candidates.
+        Built with array ops only (CSR slices of `order`); entries within a row
+        are in no particular order.
+        """
+        cx = cell_ids % self.nx
+        cy = cell_ids // self.nx
+        d = np.array([-1, 0, 1])
+        # [M, 9] wrapped neighbour cells; a grid under 3 cells wide repeats some
+        around = (
+            ((cy[:, None, None] + d[:, None]) % self.ny) * self.nx
+            + (cx[:, None, None] + d) % self.nx
+        ).reshape(len(cell_ids), 9)
+        around.sort(axis=1)
+        counts = self.starts[around + 1] - self.starts[around]
+        counts[:, 1:][around[:, 1:] == around[:, :-1]] = 0
+
+        # scatter every neighbour cell's slice of `order` into its row
+        per_row = counts.sum(axis=1)
+        width = int(per_row.max(initial=0))
+        flat = counts.ravel()
+        seg_start = np.cumsum(flat) - flat
+        seg_col = seg_start - np.repeat(seg_start[::9], 9)
+        k = np.arange(int(flat.sum())) - np.repeat(seg_start, flat)
+        rows = np.repeat(np.arange(len(cell_ids)), per_row)
+        cols = np.repeat(seg_col, flat) + k
+        src = np.repeat(self.starts[around.ravel()], flat) + k
+
+        index = np.zeros((len(cell_ids), width), dtype=np.intp)
+        valid = np.zeros((len(cell_ids), width), dtype=bool)
+        index[rows, cols] = self.order[src]
+        valid[rows, cols] = True
+        return index, valid
+
+
+class SweepBands:
+    """
+    A fixed point set sorted along x, each point's neighbours by x band.
+
+    Sweep and prune on one axis: point i's candidates are the points whose
+    wrapped x offset from it is within `half`, whatever their y. One argsort
+    and a few searchsorted calls for the whole set, nothing per point until
+    it is queried. Callers do the exact distance test on the candidates.
+    """
+
+    def __init__(self, x: np.ndarray, half: float, width: float = WORLD_WIDTH) -> None:
+        """
+        :param x:    (N,) point x positions inside the world.
+        :param half: band half-width (>= the largest query radius).
+        """
+        order = np.argsort(x, kind="stable")
+        sx = x[order]
+        self._order: List[int] = order.tolist()
+        # a hair wider, so float rounding at the edges never drops a point
+        h = half + 1e-6
+        self._all = 2.0 * h >= width
+        self._lo = np.searchsorted(sx, x - h, side="left").tolist()
+        self._hi = np.searchsorted(sx, x + h, side="right").tolist()
+        # parts of a band that wrap past x = 0 or x = width
+        lo_wrap = np.searchsorted(sx, x - h + width, side="left")
+        hi_wrap = np.searchsorted(sx, x + h - width, side="right")
+        self._lo_wrap = np.where(x - h < 0.0, lo_wrap, len(x)).tolist()
+        self._hi_wrap = np.where(x + h > width, hi_wrap, 0).tolist()
+
+    def near(self, i: int) -> List[int]:
+        """Indices of the points in point i's band (i itself included), each once."""
+        order = self._order
+        if self._all:
+            return order
+        return (
+            order[self._lo[i] : self._hi[i]]
+            + order[self._lo_wrap[i] :]
+            + order[: self._hi_wrap[i]]
+        )
@@ -10,15 +10,12 @@ instance and return dictionaries / aggregates you can log, print, or plot.
 from __future__ import annotations
 
 from collections import Counter
-from statistics import mean
-from typing import Dict, Any, Tuple, List, Optional
-
-from world import World
-from organism import Organism
+from typing import Dict, Any, List
 
+import numpy as np
 
-def _safe_mean(values: List[float], default: float = 0.0) -> float:
-    return mean(values) if values else default
+from world import World
+from organism import Organism, state_columns
 
 
 def organism_basic_stats(orgs: List[Organism]) -> Dict[str, Any]:
@@ -34,15 +31,14 @@ def organism_basic_stats(orgs: List[Organism]) -> Dict[str, Any]:
             "max_energy": 0.0,
         }
 
-    ages = [o.age for o in orgs]
-    energies = [o.energy for o in orgs]
+    ages, energies = state_columns(orgs, "age", "energy")
 
     return {
         "count": len(orgs),
-        "mean_age": _safe_mean(ages),
-        "max_age": max(ages),
-        "mean_energy": _safe_mean(energies),
-        "max_energy": max(energies),
+        "mean_age": float(ages.mean()),
+        "max_age": float(ages.max()),
+        "mean_energy": float(energies.mean()),
+        "max_energy": float(energies.max()),
     }
 
 
@@ -53,27 +49,26 @@ def organism_trait_stats(orgs: List[Organism]) -> Dict[str, Any]:
     if not orgs:
         return {}
 
-    fovs = [o.trait_fov_deg for o in orgs]
-    ranges = [o.trait_range for o in orgs]
-    thrusts = [o.trait_thrust_eff for o in orgs]
-    metas = [o.trait_metabolism_eff for o in orgs]
-    gens = [o.gen for o in orgs]
+    fovs, ranges, thrusts, metas = state_columns(
+        orgs, "trait_fov_deg", "trait_range", "trait_thrust_eff", "trait_metabolism_eff"
+    )
+    gens = np.fromiter((o.gen for o in orgs), dtype=np.int64, count=len(orgs))
 
     return {
-        "mean_fov": _safe_mean(fovs),
-        "min_fov": min(fovs),
-        "max_fov": max(fovs),
-        "mean_range": _safe_mean(ranges),
-        "min_range": min(ranges),
-        "max_range": max(ranges),
-        "mean_thrust_eff": _safe_mean(thrusts),
-        "min_thrust_eff": min(thrusts),
-        "max_thrust_eff": max(thrusts),
-        "mean_meta_eff": _safe_mean(metas),
-        "min_meta_eff": min(metas),
-        "max_meta_eff": max(metas),
-        "mean_gen": _safe_mean(gens),
-        "max_gen": max(gens),
+        "mean_fov": float(fovs.mean()),
+        "min_fov": float(fovs.min()),
+        "max_fov": float(fovs.max()),
+        "mean_range": float(ranges.mean()),
+        "min_range": float(ranges.min()),
+        "max_range": float(ranges.max()),
+        "mean_thrust_eff": float(thrusts.mean()),
+        "min_thrust_eff": float(thrusts.min()),
+        "max_thrust_eff": float(thrusts.max()),
+        "mean_meta_eff": float(metas.mean()),
+        "min_meta_eff": float(metas.min()),
+        "max_meta_eff": float(metas.max()),
+        "mean_gen": float(gens.mean()),
+        "max_gen": int(gens.max()),
     }
 
 
@@ -1,29 +1,26 @@
 import math
-from typing import List, Tuple
+from typing import List, Optional, Tuple
+
+import numpy as np
 
 from config import WORLD_WIDTH, WORLD_HEIGHT
 
+# Reciprocal world sizes for the wrap, computed once
+INV_W = 1.0 / WORLD_WIDTH
+INV_H = 1.0 / WORLD_HEIGHT
+
 
 def torus_delta(ax: float, ay: float, bx: float, by: float) -> Tuple[float, float]:
     """
     Smallest vector from (ax, ay) to (bx, by) on a torus world.
+
+    Branchless: subtract the nearest whole number of world sizes. round() ties
+    to even like np.rint, so an exact half-world offset is left as is.
     """
     dx = bx - ax
     dy = by - ay
-
-    half_w = WORLD_WIDTH / 2.0
-    half_h = WORLD_HEIGHT / 2.0
-
-    if dx > half_w:
-        dx -= WORLD_WIDTH
-    elif dx < -half_w:
-        dx += WORLD_WIDTH
-
-    if dy > half_h:
-        dy -= WORLD_HEIGHT
-    elif dy < -half_h:
-        dy += WORLD_HEIGHT
-
+    dx -= WORLD_WIDTH * round(dx * INV_W)
+    dy -= WORLD_HEIGHT * round(dy * INV_H)
     return dx, dy
 
 
@@ -31,8 +28,7 @@ def angle_diff(a: float, b: float) -> float:
     """
     Smallest signed difference between two angles a and b (radians) in [-pi, pi].
     """
-    d = (a - b + math.pi) % (2.0 * math.pi) - math.pi
-    return d
+    return (a - b + math.pi) % math.tau - math.pi
 
 
 def raycast_cone(
@@ -50,35 +46,140 @@ def raycast_cone(
     For now we don't march true rays through tiles; instead we:
 
     - Treat the cone as a continuous FOV centered on `angle` with width fov_rad.
-    - For each food item:
+    - For all food at once (NumPy over an [K, 2] position array):
         * Compute wrapped dx, dy using torus geometry.
-        * Compute distance and bearing relative to the organism.
-        * If within range AND within FOV, we record it as a "hit".
+        * Rotate them once into the organism's frame (forward, side).
+        * If within range AND within FOV, we record it as a "hit"; the FOV
+          test is forward >= cos(fov/2) * dist, so only hits need atan2.
+
+    `foods` is a FoodStore (its `xy` mirror is used directly) or any sequence
+    of objects with .x/.y.
 
     Returns:
-        List of (relative_angle, distance) tuples for all hits,
+        List of (relative_angle, distance) tuples for all hits, in food order,
         where relative_angle = angle_to_food - angle, in radians.
         Negative values = to the left, positive = to the right.
 
     The `rays` parameter is currently unused but kept for API compatibility
     and future extension to true ray-marching against terrain.
     """
-    hits: List[Tuple[float, float]] = []
-    half_fov = fov_rad / 2.0
+    if not len(foods):
+        return []
+
+    food_xy = getattr(foods, "xy", None)
+    if food_xy is None:
+        food_xy = np.array([(f.x, f.y) for f in foods], dtype=np.float64)
 
-    if not foods:
-        return hits
+    fwd, side, dist = _local_frame(x, y, math.cos(angle), math.sin(angle), food_xy)
+    seen = (dist > 0.0) & (dist <= rng_len) & (fwd >= np.cos(fov_rad / 2.0) * dist)
+    rel = np.arctan2(side[seen], fwd[seen])
+    return list(zip(rel.tolist(), dist[seen].tolist()))
 
-    for f in foods:
-        dx, dy = torus_delta(x, y, f.x, f.y)
-        dist = math.hypot(dx, dy)
-        if dist <= 0.0 or dist > rng_len:
-            continue
 
-        ang_to = math.atan2(dy, dx)
-        rel = angle_diff(ang_to, angle)
+def _local_frame(x, y, ca, sa, food_xy: np.ndarray):
+    """
+    Wrapped offsets to every food rotated into the viewer's heading frame.
 
-        if abs(rel) <= half_fov:
-            hits.append((rel, dist))
+    ca, sa: cos and sin of the viewer's heading angle.
+    Returns (forward, side, dist); side < 0 means to the left, i.e. the sign
+    of angle_diff(bearing, angle). x, y, ca, sa may be (N, 1) columns, and
+    food_xy then either [K, 2] shared or [N, K, 2] per viewer.
+    """
+    dx = food_xy[..., 0] - x
+    dy = food_xy[..., 1] - y
+    dx -= WORLD_WIDTH * np.rint(dx * INV_W)
+    dy -= WORLD_HEIGHT * np.rint(dy * INV_H)
+    # plain sqrt of the squared length: np.hypot's overflow-safe scaling is
+    # ~3x slower and buys nothing at world-sized offsets
+    return dx * ca + dy * sa, dy * ca - dx * sa, np.sqrt(dx * dx + dy * dy)
 
-    return hits
+
+def cone_strengths(
+    x: float,
+    y: float,
+    angle: float,
+    fov_rad: float,
+    rng_len: float,
+    food_xy: np.ndarray,
+    heading: Optional[Tuple[float, float]] = None,
+) -> Tuple[float, float]:
+    """
+    Vectorized raycast_cone + nearest-hit reduction over all food at once.
+
+    food_xy: [K, 2] array of food positions (FoodStore.xy32: the math runs in
+    float32, the precision of the brain inputs it feeds).
+    heading: (cos, sin) of `angle`, if the caller already has them.
+
+    Returns:
+        (left, right) activations: max over hits of 1 - dist / rng_len, split
+        by the sign of the relative angle as raycast_cone reports it.
+    """
+    if len(food_xy) == 0 or rng_len <= 0.0:
+        return 0.0, 0.0
+
+    f32 = np.float32
+    ca, sa = heading if heading is not None else (math.cos(angle), math.sin(angle))
+    fwd, side, dist = _local_frame(
+        f32(x), f32(y), f32(ca), f32(sa), np.asarray(food_xy, dtype=f32)
+    )
+    rng_len = f32(rng_len)
+    seen = (dist > 0.0) & (dist <= rng_len) & (fwd >= f32(math.cos(fov_rad / 2.0)) * dist)
+
+    strength = 1.0 - dist / rng_len
+    left = strength[seen & (side < 0)]
+    right = strength[seen & (side >= 0)]
+    return (
+        float(left.max()) if left.size else 0.0,
+        float(right.max()) if right.size else 0.0,
+    )
+
+
+def cone_strengths_many(
+    x: np.ndarray,
+    y: np.ndarray,
+    angle: np.ndarray,
+    fov_rad: np.ndarray,
+    rng_len: np.ndarray,
+    food_xy: np.ndarray,
+    valid: Optional[np.ndarray] = None,
+    heading: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+) -> np.ndarray:
+    """
+    cone_strengths() for N viewers, as [N, K] array ops.
+
+    x, y, angle, fov_rad, rng_len: (N,) arrays; food_xy: [K, 2] seen by every
+    viewer, or [N, K, 2] with a food set per viewer, in float32 as for
+    cone_strengths() (other inputs are cast to match). valid: optional [N, K]
+    mask of which per-viewer entries are real (the rest are padding).
+    heading: optional (cos, sin) (N,) arrays of `angle`.
+
+    Returns:
+        [N, 2] array of (left, right) activations, equal to calling
+        cone_strengths() per viewer.
+    """
+    out = np.zeros((len(x), 2))
+    if len(x) == 0 or food_xy.shape[-2] == 0:
+        return out
+
+    def col(v):
+        return v.astype(np.float32)[:, None]
+
+    ca, sa = heading if heading is not None else (np.cos(angle), np.sin(angle))
+    fwd, side, dist = _local_frame(
+        col(x), col(y), col(ca), col(sa), np.asarray(food_xy, dtype=np.float32)
+    )
+    rng_len = col(rng_len)
+    seen = (
+        (dist > 0.0)
+        & (dist <= rng_len)
+        & (fwd >= col(np.cos(fov_rad / 2.0)) * dist)
+    )
+    if valid is not None:
+        seen &= valid
+
+    # hits are >= 0, so 0 doubles as "nothing seen" in the max
+    strength = np.where(seen, 1.0 - dist / rng_len, 0.0)
+    on_left = side < 0
+    out[:, 0] = np.where(on_left, strength, 0.0).max(axis=1)
+    out[:, 1] = np.where(on_left, 0.0, strength).max(axis=1)
+    return out
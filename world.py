@@ -1,10 +1,15 @@
 import math
 import random
-from dataclasses import dataclass
-from typing import List, Optional, Dict, Tuple, Set
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator, List, Optional, Dict, Tuple
 
-from organism import Organism
-from vision import torus_delta
+import numpy as np
+
+from brain import BrainPool
+from genetics import inherit_traits_batch
+from spatial import SweepBands, UniformGrid
+from organism import Organism, OrganismPool, dev_learning_scale, reflex_shape
+from vision import INV_H, INV_W
 from config import (
     WORLD_WIDTH,
     WORLD_HEIGHT,
@@ -32,17 +37,127 @@ from config import (
     SEXUAL_REPRODUCTION,
     MATING_RADIUS,
     MATING_DRIVE_STRENGTH,
+    # eating
+    EAT_RADIUS,
 )
 
+# Food respawn samples drawn per np_rng call (see World._next_respawn_draw)
+_RESPAWN_DRAW_BLOCK = 64
+
+# Config-only parts of the Environment temperature/growth formulas, folded once
+_INV_HEIGHT = 1.0 / max(WORLD_HEIGHT, 1e-6)
+_TEMP_SPAN = BASE_TEMPERATURE_EQUATOR - BASE_TEMPERATURE_POLE
+_AMP_SPAN = SEASONAL_VARIATION_EQUATOR - SEASONAL_VARIATION_POLE
+_INV_TOL2 = 1.0 / max(TEMP_TOLERANCE, 1e-6) ** 2
+
 # --------------------------------------------------------------------- #
 # Simple Food object
 # --------------------------------------------------------------------- #
 
 
-@dataclass
+# slots: no per-instance __dict__, as there can be MAX_FOOD of these alive
+@dataclass(slots=True)
 class Food:
     x: float
     y: float
+    # index in the FoodStore holding it (kept up to date by the store), for O(1) remove()
+    _slot: int = field(default=-1, init=False, repr=False, compare=False)
+
+
+class FoodStore:
+    """
+    The world's food particles plus contiguous [N, 2] mirrors of their
+    positions, float64 (`xy`, exact like the Food objects) and float32 (`xy32`,
+    for the sensing kernels), and a uniform grid of their indices for
+    eat-radius lookups (`near`).
+
+    Behaves like the plain list it replaces (len, iteration, indexing, append,
+    remove); every mutation goes through here so `xy` and the grid stay in sync.
+    Removal is a swap-with-last pop, never a shifting list delete.
+    """
+
+    def __init__(self, foods=(), capacity: int = MAX_FOOD) -> None:
+        self._items: List[Food] = []
+        self._xy = np.empty((max(1, capacity), 2), dtype=np.float64)
+        self._xy32 = np.empty((max(1, capacity), 2), dtype=np.float32)
+        self._grid = UniformGrid(EAT_RADIUS * 2.0)
+        for f in foods:
+            self.append(f)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __getitem__(self, i):
+        return self._items[i]
+
+    @property
+    def xy(self) -> np.ndarray:
+        """Positions of all foods, row i matching self[i] (a view; don't keep it)."""
+        return self._xy[: len(self._items)]
+
+    @property
+    def xy32(self) -> np.ndarray:
+        """`xy` rounded to float32 (a view; don't keep it)."""
+        return self._xy32[: len(self._items)]
+
+    def append(self, f: Food) -> None:
+        n = len(self._items)
+        if n == self._xy.shape[0]:
+            grown = np.empty((2 * n, 2), dtype=np.float64)
+            grown[:n] = self._xy
+            self._xy = grown
+            grown32 = np.empty((2 * n, 2), dtype=np.float32)
+            grown32[:n] = self._xy32[:n]
+            self._xy32 = grown32
+        self._xy[n] = self._xy32[n] = (f.x, f.y)
+        self._items.append(f)
+        f._slot = n
+        self._grid.insert(n, f.x, f.y)
+
+    def near(self, x: float, y: float) -> Iterator[int]:
+        """
+        Indices of foods that may lie within EAT_RADIUS of (x, y).
+
+        Lazy: stop iterating before calling pop_swap().
+        """
+        return self._grid.near(x, y)
+
+    def pop_swap(self, i: int) -> Food:
+        """
+        O(1) removal of food i: the last food moves into slot i.
+
+        Order is not preserved, which nothing relies on.
+        """
+        items = self._items
+        last = len(items) - 1
+        f = items[i]
+        self._grid.remove(i, f.x, f.y)
+        if i != last:
+            moved = items[last]
+            items[i] = moved
+            moved._slot = i
+            self._xy[i] = self._xy[last]
+            self._xy32[i] = self._xy32[last]
+            self._grid.rekey(last, i, moved.x, moved.y)
+        items.pop()
+        return f
+
+    def remove(self, f: Food) -> None:
+        """O(1) via the food's own slot; like list.remove, ValueError if absent."""
+        i = f._slot
+        if not (0 <= i < len(self._items) and self._items[i] is f):
+            i = self._items.index(f)
+        self.pop_swap(i)
+
+    def truncate(self, n: int) -> None:
+        """Keep only the first n foods."""
+        for i in range(n, len(self._items)):
+            f = self._items[i]
+            self._grid.remove(i, f.x, f.y)
+        del self._items[n:]
 
 
 # --------------------------------------------------------------------- #
@@ -70,8 +185,12 @@ class Environment:
 
         self.day_night_factor: float = 1.0  # 0 = deep night, 1 = noon
         self.season_phase: float = 0.0      # 0..1 over a “year”
+        # cos(2*pi*season_phase): shared by precipitation and every temperature_at_y()
+        self._cos_season: float = 1.0
         self.precipitation: float = BASE_PRECIPITATION  # 0..1
         self.last_global_growth_rate: float = BASE_REGROWTH
+        # y-independent part of growth_rate_at(), refreshed by update()
+        self._growth_scale: float = self._weather_growth_scale()
 
     # ----------------------------- #
     # Core update
@@ -87,14 +206,17 @@ class Environment:
 
         # Seasonal phase [0,1)
         self.season_phase = (self.time % YEAR_LENGTH) / max(YEAR_LENGTH, 1e-6)
+        self._cos_season = math.cos(2.0 * math.pi * self.season_phase)
 
         # Precipitation: base + seasonal oscillation + noise, clamped to [0,1]
-        base_precip = BASE_PRECIPITATION + PRECIP_VARIATION * math.cos(
-            2.0 * math.pi * self.season_phase
-        )
+        base_precip = BASE_PRECIPITATION + PRECIP_VARIATION * self._cos_season
         noise = self.rng.uniform(-PRECIP_NOISE, PRECIP_NOISE)
         self.precipitation = max(0.0, min(1.0, base_precip + noise))
 
+        # Weather is fixed for the rest of the tick: evaluate its growth
+        # factors once for every growth_rate_at() call (respawns, stats)
+        self._growth_scale = self._weather_growth_scale()
+
         # Track a default global growth rate at mid-latitude (for debugging/insight)
         mid_y = WORLD_HEIGHT / 2.0
         self.last_global_growth_rate = self.growth_rate_at(mid_y)
@@ -110,7 +232,7 @@ class Environment:
         0 = equator, 1 = pole.
         Middle of the map = equator; top/bottom = poles.
         """
-        ny = y / max(WORLD_HEIGHT, 1e-6)
+        ny = y * _INV_HEIGHT
         # Map [0,1] -> [-1,1], then take abs: equator at 0.5
         lat = abs(2.0 * ny - 1.0)
         return max(0.0, min(1.0, lat))
@@ -119,38 +241,45 @@ class Environment:
         """
         Latitude + season dependent temperature (°C).
         """
-        lat = self._lat_from_y(y)
-        base_temp = BASE_TEMPERATURE_POLE + (BASE_TEMPERATURE_EQUATOR - BASE_TEMPERATURE_POLE) * (
-            1.0 - lat
-        )
-        seasonal_amp = SEASONAL_VARIATION_POLE + (
-            SEASONAL_VARIATION_EQUATOR - SEASONAL_VARIATION_POLE
-        ) * (1.0 - lat)
+        eq = 1.0 - self._lat_from_y(y)
+        base_temp = BASE_TEMPERATURE_POLE + _TEMP_SPAN * eq
+        seasonal_amp = SEASONAL_VARIATION_POLE + _AMP_SPAN * eq
 
-        season_term = seasonal_amp * math.cos(2.0 * math.pi * self.season_phase)
+        season_term = seasonal_amp * self._cos_season
         temp = base_temp + season_term
         return temp
 
-    def growth_rate_at(self, y: float) -> float:
+    def _weather_growth_scale(self) -> float:
+        """BASE_REGROWTH * precip_factor * day_factor for the current weather."""
+        # Precipitation factor: ensure non-zero even when dry
+        precip_factor = 0.3 + 0.7 * self.precipitation
+
+        # Day/night: more growth during “day”
+        day_factor = 0.3 + 0.7 * self.day_night_factor
+
+        return BASE_REGROWTH * precip_factor * day_factor
+
+    def growth_rate_at(self, y: float, u: Optional[float] = None) -> float:
         """
         Weather-dependent growth rate (per-second probability scale) at a given y.
 
         growth ≈ BASE_REGROWTH * temp_factor * precip_factor * day_factor + noise
+
+        Only temp_factor depends on y; the rest comes from update().
+        u: optional uniform [0, 1) sample for the noise, if the caller already
+        drew one; otherwise it comes from self.rng.
         """
         temp = self.temperature_at_y(y)
 
         # Temperature factor: peaked around OPTIMAL_GROWTH_TEMP, falls off with squared distance
-        diff = abs(temp - OPTIMAL_GROWTH_TEMP)
-        temp_factor = max(0.0, 1.0 - (diff / max(TEMP_TOLERANCE, 1e-6)) ** 2)
-
-        # Precipitation factor: ensure non-zero even when dry
-        precip_factor = 0.3 + 0.7 * self.precipitation
-
-        # Day/night: more growth during “day”
-        day_factor = 0.3 + 0.7 * self.day_night_factor
+        diff = temp - OPTIMAL_GROWTH_TEMP
+        temp_factor = max(0.0, 1.0 - diff * diff * _INV_TOL2)
 
-        growth = BASE_REGROWTH * temp_factor * precip_factor * day_factor
-        noise = self.rng.uniform(-GROWTH_NOISE, GROWTH_NOISE)
+        growth = temp_factor * self._growth_scale
+        if u is None:
+            noise = self.rng.uniform(-GROWTH_NOISE, GROWTH_NOISE)
+        else:
+            noise = GROWTH_NOISE * (2.0 * u - 1.0)
         growth = max(0.0, growth + noise)
         return growth
 
@@ -161,6 +290,47 @@ class Environment:
         return self.last_global_growth_rate
 
 
+# --------------------------------------------------------------------- #
+# Mate search
+# --------------------------------------------------------------------- #
+
+
+def _find_best_mate(
+    i: int,
+    near: Iterable[int],
+    xs: List[float],
+    ys: List[float],
+    sexes: List[str],
+    used: bytearray,
+) -> int:
+    """
+    Nearest opposite-sex partner for candidate i within MATING_RADIUS.
+
+    near: broad-phase candidates around i; only j > i with used[j] == 0 count,
+    scanned in ascending order so the last of equally near partners wins
+    (the original scan's tie-breaking). xs, ys, sexes are flat per-candidate
+    lists, `used` one flag byte per candidate.
+
+    :return: index of the partner, or -1 if there is none.
+    """
+    best = -1
+    best_d2 = MATING_RADIUS * MATING_RADIUS
+    ax, ay, sex = xs[i], ys[i], sexes[i]
+    for j in sorted(near):
+        if j <= i or sexes[j] == sex or used[j]:
+            continue
+        # torus_delta() inlined
+        dx = xs[j] - ax
+        dy = ys[j] - ay
+        dx -= WORLD_WIDTH * round(dx * INV_W)
+        dy -= WORLD_HEIGHT * round(dy * INV_H)
+        d2 = dx * dx + dy * dy
+        if d2 <= best_d2:
+            best_d2 = d2
+            best = j
+    return best
+
+
 # --------------------------------------------------------------------- #
 # World: organisms + food + environment
 # --------------------------------------------------------------------- #
@@ -169,16 +339,32 @@ class Environment:
 class World:
     def __init__(self, rng: Optional[random.Random] = None) -> None:
         self.rng: random.Random = random.Random() if rng is None else rng
+        self.np_rng: np.random.Generator = np.random.default_rng()
         self.env: Environment = Environment(self.rng)
 
         self.orgs: List[Organism] = []
-        self.foods: List[Food] = []
+        self.foods: FoodStore = FoodStore()
+        self.brain_pool: BrainPool = BrainPool()
+        self.org_pool: OrganismPool = OrganismPool()
+        # brain input matrix, reused every tick (grown on demand)
+        self._x_buf: np.ndarray = np.empty((0, self.brain_pool.in_size), dtype=np.float32)
 
         self.time: float = 0.0
         self.births: int = 0
         self.deaths: int = 0
         self.mutations: int = 0
         self.generation_high: int = 0
+        # value of `deaths` when the dead were last dropped from `orgs`
+        self._deaths_removed: int = 0
+        # id -> organism for everyone in `orgs` (kept in step with it), and
+        # for everyone who has dependents (set at their births)
+        self._by_id: Dict[int, Organism] = {}
+        self._parents: Dict[int, Organism] = {}
+        # unused rows of the current block of respawn samples
+        self._respawn_draws: List[List[float]] = []
+
+        # Per-tick stats shared by console + CSV logging; cleared by step()/reset()
+        self._cached_stats: Optional[Dict[str, float]] = None
 
     # ----------------------------- #
     # Reset / initialization
@@ -194,6 +380,10 @@ class World:
         """
         self.time = 0.0
         self.births = self.deaths = self.mutations = 0
+        self._deaths_removed = 0
+        self._parents = {}
+        self._respawn_draws = []
+        self._cached_stats = None
         self.generation_high = 0
 
         # Reset environment
@@ -214,13 +404,21 @@ class World:
                 for _ in range(START_ORGS)
             ]
 
-        self.foods = [
+        self.brain_pool = BrainPool(seed=self.rng.getrandbits(63))
+        self.np_rng = np.random.default_rng(self.rng.getrandbits(63))
+        self.org_pool = OrganismPool()
+        for o in self.orgs:
+            self.brain_pool.attach(o.brain)
+            self.org_pool.attach(o)
+        self._by_id = {o.id: o for o in self.orgs}
+
+        self.foods = FoodStore(
             Food(
                 self.rng.uniform(0, WORLD_WIDTH),
                 self.rng.uniform(0, WORLD_HEIGHT),
             )
             for _ in range(START_FOOD)
-        ]
+        )
 
     # ----------------------------- #
     # Step
@@ -240,65 +438,103 @@ class World:
         # Update time & environment
         self.time += dt
         self.env.update(dt)
+        self._cached_stats = None
 
         new_orgs: List[Organism] = []
-        used_for_mating: Set[int] = set()
-
-        # Step organisms
-        for o in list(self.orgs):
-            if not o.alive:
-                continue
-
-            ate = o.step(dt, self.foods, self.rng, env=self.env)
-
-            # Weather- & population-aware respawn when food is eaten
-            if ate and FOOD_RESPAWN and len(self.foods) < MAX_FOOD:
-                # population factor: respawn less when we are over target pop
-                k_pop = max(0.15, 1.0 - (len(self.orgs) / max(1, TARGET_POP)))
-
-                # pick a random spot and compute growth there
-                fx = self.rng.uniform(0, WORLD_WIDTH)
-                fy = self.rng.uniform(0, WORLD_HEIGHT)
-                growth_rate = self.env.growth_rate_at(fy)  # per-second-like scale
-
-                # approximate per-step probability
-                prob = k_pop * growth_rate * dt
-                prob = max(0.0, min(1.0, prob))
 
-                if prob > 0.0 and self.rng.random() < prob:
-                    self.foods.append(Food(fx, fy))
+        # Sense for every awake organism, run all their brains in one batch,
+        # then shape the outputs and move all their bodies in one batch
+        awake = [o for o in self.orgs if o.alive and o.awake]
+        asleep = [o for o in self.orgs if o.alive and not o.awake]
+        if awake:
+            # float32 to match the brain weights: forward_batch() uses it as is
+            x_cols = self.brain_pool.in_size
+            if len(self._x_buf) < len(awake):
+                self._x_buf = np.empty((2 * len(awake), x_cols), dtype=np.float32)
+            x = self._x_buf[: len(awake)]
+            # headings only change in physics_step: one cos/sin for sensing and thrust
+            heading = self.org_pool.heading(awake)
+            self.org_pool.brain_inputs(awake, self.foods, x, heading)
+            actions = self.brain_pool.forward_batch([o.brain for o in awake], x)
+            turn, thrust = reflex_shape(x[:, 0], x[:, 1], actions[:, 0], actions[:, 1])
+            speed, cost = self.org_pool.physics_step(awake, dt, thrust, turn, heading)
+
+            # Eat in list order: a respawn may put food in reach of the next one.
+            # Who can reach food at all is decided for everyone up front; the
+            # rest only need the ordered check once something has respawned.
+            reach = self.org_pool.in_eat_reach(awake, self.foods.xy).tolist()
+            # population factor: respawn less when we are over target pop
+            # (self.orgs only changes after this loop)
+            k_pop = max(0.15, 1.0 - (len(self.orgs) / max(1, TARGET_POP)))
+            spawned = False
+            ate = np.zeros(len(awake), dtype=bool)
+            for i, o in enumerate(awake):
+                if (reach[i] or spawned) and o.eat(self.foods):
+                    ate[i] = True
+                    if FOOD_RESPAWN:
+                        spawned |= self._respawn_food(dt, k_pop)
+
+            # Energy, age and rewards for all of them at once
+            rewards, starved = self.org_pool.metabolism_step(awake, dt, cost, ate)
+
+            # One copy per tick for the replay memories; each keeps its row views
+            kept_x = x.copy()
+            kept_actions = np.column_stack((turn, thrust)).astype(np.float32)
+            for o, x_row, action, reward, dead in zip(
+                awake, kept_x, kept_actions, rewards.tolist(), starved.tolist()
+            ):
+                if dead:
+                    o.alive = False
+                    self.deaths += 1
+                o.record_tick(x_row, action, reward, dt, self.env)
 
-            # Count deaths
+        # Step sleepers; dream replay is sampled now and run batched below
+        for o in asleep:
+            o.step(dt, self.foods, self.rng, env=self.env, defer_dreams=True)
             if not o.alive:
                 self.deaths += 1
 
-        # Reproduction phase (after movement/eating)
+        # Dream replay for everyone who slept this tick, step k of all sleepers at once
+        dreamers = [o for o in self.orgs if o.pending_dreams is not None]
+        if dreamers:
+            self._replay_dreams(dreamers)
+
+        # Online plasticity for everyone that ran the batched forward pass,
+        # with the developmental learning scale computed for all of them at once
+        if awake:
+            rewards *= dev_learning_scale(self.org_pool.age[self.org_pool.slots(awake)])
+            self.brain_pool.apply_plasticity_batch(
+                [o.brain for o in awake], rewards.astype(np.float32)
+            )
+
+        # Reproduction phase (after movement/eating); who is fertile is one
+        # mask over the pool's energy column
+        fertile = self.org_pool.can_reproduce(self.orgs)
+        fertile_orgs = [self.orgs[i] for i in np.flatnonzero(fertile).tolist()]
         if SEXUAL_REPRODUCTION:
             # Sexual reproduction: find compatible mates within MATING_RADIUS
-            org_list = [o for o in self.orgs if o.alive and o.can_reproduce()]
+            org_list = fertile_orgs
+            # Positions and sexes read once from the pool's columns as flat lists
+            idx = self.org_pool.slots(org_list)
+            x = self.org_pool.x[idx]
+            xs = x.tolist()
+            ys = self.org_pool.y[idx].tolist()
+            sexes = [o.sex for o in org_list]
+            # who has mated this tick, by position in org_list
+            used = bytearray(len(org_list))
+            # Only organisms within MATING_RADIUS of `a` along x can be within
+            # MATING_RADIUS: one sort for the whole list instead of a grid insert each
+            bands = SweepBands(x, MATING_RADIUS)
+
             for i, a in enumerate(org_list):
-                if a.id in used_for_mating:
+                if used[i]:
                     continue
                 if self.rng.random() > MATING_DRIVE_STRENGTH:
                     continue
 
-                best_partner = None
-                best_d2 = MATING_RADIUS * MATING_RADIUS
-
-                for j in range(i + 1, len(org_list)):
-                    b = org_list[j]
-                    if b.id in used_for_mating:
-                        continue
-                    if a.sex == b.sex:
-                        continue
-                    # distance on torus
-                    dx, dy = torus_delta(a.x, a.y, b.x, b.y)
-                    d2 = dx * dx + dy * dy
-                    if d2 <= best_d2:
-                        best_d2 = d2
-                        best_partner = b
-
-                if best_partner is not None:
+                j = _find_best_mate(i, bands.near(i), xs, ys, sexes, used)
+                if j >= 0:
+                    best_partner = org_list[j]
                     child = Organism.reproduce_sexual(a, best_partner, self.rng)
                     if child is not None:
                         new_orgs.append(child)
@@ -306,59 +542,135 @@ class World:
                         self.mutations += 1
                         if child.gen > self.generation_high:
                             self.generation_high = child.gen
-                        used_for_mating.add(a.id)
-                        used_for_mating.add(best_partner.id)
+                        used[i] = used[j] = 1
+                        self._parents[a.id] = a
+                        self._parents[best_partner.id] = best_partner
         else:
-            # Asexual reproduction
-            for o in list(self.orgs):
-                if not o.alive:
-                    continue
-                if o.can_reproduce():
-                    child = o.reproduce_asexual(self.rng)
+            # Asexual reproduction: mutate all of this tick's child traits in one pass
+            parents = fertile_orgs
+            if parents:
+                child_traits = inherit_traits_batch(
+                    self.org_pool.traits(parents), self.np_rng
+                )
+                for o, traits in zip(parents, child_traits.tolist()):
+                    child = o.reproduce_asexual(self.rng, traits=tuple(traits))
                     new_orgs.append(child)
+                    self._parents[o.id] = o
                     self.births += 1
                     self.mutations += 1
                     if child.gen > self.generation_high:
                         self.generation_high = child.gen
 
-        # Remove dead organisms, add newborns
-        self.orgs = [o for o in self.orgs if o.alive]
+        # Remove dead organisms (freeing their pool rows), add newborns. Every
+        # death is counted in `deaths`, so most ticks can skip the rebuild.
+        if self.deaths != self._deaths_removed:
+            for o in self.orgs:
+                if not o.alive:
+                    self.brain_pool.release(o.brain)
+                    self.org_pool.release(o)
+                    self._by_id.pop(o.id, None)
+            self.orgs = [o for o in self.orgs if o.alive]
+            self._deaths_removed = self.deaths
+        for child in new_orgs:
+            self.brain_pool.attach(child.brain)
+            self.org_pool.attach(child)
+            self._by_id[child.id] = child
         self.orgs.extend(new_orgs)
 
         # Parental nurture phase: parents can build homes & feed dependents
-        id_map: Dict[int, Organism] = {o.id: o for o in self.orgs}
-        cared_children: Set[int] = set()
-
-        for parent in self.orgs:
-            if not parent.dependents:
+        cared: List[int] = []
+
+        # Only organisms with dependents take part: visit just those, in id
+        # order (= their order in self.orgs, which only ever appends newborns)
+        for pid in sorted(self._parents):
+            parent = self._parents[pid]
+            if not parent.alive:
+                del self._parents[pid]
                 continue
 
             # Encourage home building for parents
             parent.maybe_build_home()
 
-            for child_id in list(parent.dependents):
-                child = id_map.get(child_id)
+            for child_id in parent.dependents:
+                child = self._by_id.get(child_id)
                 if child is None or not child.alive:
                     continue
                 parent.nurture_child(child)
-                cared_children.add(child.id)
+                cared.append(child._slot)
 
         # Optional: apply a mild orphan penalty to children without caregivers
         # (you can tune or expand this later)
-        for child in self.orgs:
-            # quick check: only for “young” organisms
-            from config import CHILD_DEPENDENCY_AGE, ORPHAN_PENALTY  # local import to avoid cycle
-
-            if child.age < CHILD_DEPENDENCY_AGE and child.id not in cared_children:
-                # Small extra energy drain if no caregivers
-                child.energy -= (1.0 - ORPHAN_PENALTY) * 0.01 * dt
-                if child.energy <= 0.0:
-                    child.alive = False
-                    self.deaths += 1
+        # applied to all young organisms at once over the pool's age/energy columns
+        starved = self.org_pool.orphan_penalty(self.orgs, cared, dt)
+        for i in np.flatnonzero(starved).tolist():
+            self.orgs[i].alive = False
+            self.deaths += 1
 
         # Trim food list if over capacity (hard cap)
         if len(self.foods) > MAX_FOOD:
-            self.foods = self.foods[:MAX_FOOD]
+            self.foods.truncate(MAX_FOOD)
+
+    def _respawn_food(self, dt: float, k_pop: float) -> bool:
+        """
+        Weather- & population-aware respawn after a food was eaten.
+
+        Only called with FOOD_RESPAWN on. The eat just freed a slot, so the
+        capacity test only trips while a store that started over MAX_FOOD
+        waits for the end-of-step truncate().
+
+        :param k_pop: population factor for this tick, computed by the caller.
+        :return: True if a new food was placed.
+        """
+        if len(self.foods) >= MAX_FOOD:
+            return False
+
+        # pick a random spot and compute growth there
+        u_x, u_y, u_noise, u_accept = self._next_respawn_draw()
+        fx = u_x * WORLD_WIDTH
+        fy = u_y * WORLD_HEIGHT
+        growth_rate = self.env.growth_rate_at(fy, u_noise)  # per-second-like scale
+
+        # approximate per-step probability
+        prob = k_pop * growth_rate * dt
+        prob = max(0.0, min(1.0, prob))
+
+        if prob > 0.0 and u_accept < prob:
+            self.foods.append(Food(fx, fy))
+            return True
+        return False
+
+    def _next_respawn_draw(self) -> List[float]:
+        """
+        Next (x, y, noise, accept) uniform samples for _respawn_food().
+
+        Drawn from np_rng _RESPAWN_DRAW_BLOCK rows at a time, so a tick with
+        many respawns costs one generator call rather than four per event.
+        """
+        if not self._respawn_draws:
+            self._respawn_draws = self.np_rng.random((_RESPAWN_DRAW_BLOCK, 4)).tolist()
+        return self._respawn_draws.pop()
+
+    def _replay_dreams(self, dreamers: List[Organism]) -> None:
+        """
+        Replay every dreamer's pending_dreams through the BrainPool.
+
+        Each brain still sees its own replays in order (forward, then Hebbian
+        update), but replay k of all dreamers runs as one forward_batch() and
+        one apply_plasticity_batch().
+        """
+        brains = [o.brain for o in dreamers]
+        xs = [o.pending_dreams[0] for o in dreamers]
+        rewards = [o.pending_dreams[1] for o in dreamers]
+        # age is fixed for the whole replay, so is the learning scale
+        scales = dev_learning_scale(self.org_pool.age[self.org_pool.slots(dreamers)])
+        for o in dreamers:
+            o.pending_dreams = None
+
+        # every dreamer slept the same dt, so they share one replay count
+        for k in range(len(xs[0])):
+            self.brain_pool.forward_batch(brains, np.stack([x[k] for x in xs]))
+            r = np.array([rw[k] for rw in rewards]) * scales
+            self.brain_pool.apply_plasticity_batch(brains, r.astype(np.float32))
 
     # ----------------------------- #
     # Convenience / stats
@@ -371,11 +683,28 @@ class World:
         return self.orgs[0] if self.orgs else None
 
     def avg_traits(self) -> Tuple[float, float, float, float]:
-        if not self.orgs:
-            return 0.0, 0.0, 0.0, 0.0
-        n = len(self.orgs)
-        fov = sum(o.trait_fov_deg for o in self.orgs) / n
-        rng = sum(o.trait_range for o in self.orgs) / n
-        thr = sum(o.trait_thrust_eff for o in self.orgs) / n
-        met = sum(o.trait_metabolism_eff for o in self.orgs) / n
-        return fov, rng, thr, met
+        s = self.tick_stats()
+        return s["fov"], s["rng"], s["thr"], s["meta"]
+
+    def tick_stats(self) -> Dict[str, float]:
+        """
+        Trait averages + sampled temperature for the current tick.
+
+        Computed at most once per step() and shared by every logger.
+        """
+        if self._cached_stats is not None:
+            return self._cached_stats
+
+        fov = rng = thr = met = 0.0
+        if self.orgs:
+            # one reduction over the pool's trait columns
+            fov, rng, thr, met = self.org_pool.traits(self.orgs).mean(axis=0).tolist()
+
+        self._cached_stats = {
+            "temp": self.env.temperature_at_y(self.env.time % 1 * 100),  # quick sampling
+            "fov": fov,
+            "rng": rng,
+            "thr": thr,
+            "meta": met,
+        }
+        return self._cached_stats